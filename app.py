@@ -15,6 +15,7 @@ sys.path.insert(0, str(project_root))
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 from circuit_designer.core.main_window import MainWindow
+from circuit_designer.ui.constants import APP_STYLESHEET
 
 
 def main():
@@ -28,6 +29,7 @@ def main():
     app = QApplication(sys.argv)
     app.setApplicationName("Circuit Designer")
     app.setOrganizationName("Circuit Designer Team")
+    app.setStyleSheet(APP_STYLESHEET)
 
     # Create and show main window
     window = MainWindow()
@@ -4,6 +4,7 @@ Handles graphical components that can be placed and manipulated in the circuit.
 """
 
 import math
+import sys
 from PyQt6.QtWidgets import QGraphicsRectItem, QGraphicsPixmapItem
 from PyQt6.QtCore import Qt, QPointF
 from PyQt6.QtGui import QPen, QColor, QBrush, QPixmap, QPainter
@@ -14,13 +15,16 @@ class ComponentItem(QGraphicsRectItem):
     """A draggable component item in the graphics scene"""
     def __init__(self, component_type, size_w, size_h, grid_spacing):
         self.grid_spacing = grid_spacing
-        self.component_type = component_type
+        # Interned, so the many `component_type == "Resistor"` style checks
+        # hit the identity fast path also for types loaded from project files
+        self.component_type = sys.intern(component_type)
         self.size_w = size_w  # in grid cells (original orientation width)
         self.size_h = size_h  # in grid cells (original orientation height)
         self.name = component_type  # Default name
         self.value = self.get_default_value()  # Component value
         self.orientation = 0  # Default orientation in degrees (0,90,180,270)
         self.net_id = ""  # Network ID for circuit analysis
+        self._occupied_cells_cache = None  # (position key, cells) of get_occupied_grid_cells
 
         # LED-specific: threshold voltage
         if component_type == "LED":
@@ -231,7 +235,12 @@ class ComponentItem(QGraphicsRectItem):
             if self.isSelected() and self.scene() and self.scene().views():
                 main_window = self.scene().views()[0].main_window
                 if hasattr(main_window, 'inspect_panel'):
-                    main_window.inspect_panel.update_component_data(self)
+                    inspect_panel = main_window.inspect_panel
+                    if inspect_panel.selected_component is self:
+                        # Already shown: a move only changes the position row
+                        inspect_panel.update_component_position(self)
+                    else:
+                        inspect_panel.update_component_data(self)
         return super().itemChange(change, value)
 
     def update_from_inspect_panel(self, name, value, orientation, net_id):
@@ -665,13 +674,25 @@ class ComponentItem(QGraphicsRectItem):
         self.update_connected_wires()
 
     def get_occupied_grid_cells(self, base_gx=None, base_gy=None):
-        """Return a set of (gx, gy) cells occupied by this component based on its orientation.
+        """Return the (gx, gy) cells occupied by this component based on its orientation.
         If base_gx/base_gy provided, treat that as anchor grid coordinate instead of current.
         Anchor grid coordinate corresponds to get_display_grid_position().
         Fills all cells in the eff_w x eff_h rectangle."""
-        gx, gy = self.get_display_grid_position()
         if base_gx is not None and base_gy is not None:
-            gx, gy = base_gx, base_gy
+            return self._footprint_cells(base_gx, base_gy)
+
+        # The current footprint only changes when the item moves, rotates or
+        # enters/leaves a view; reuse it until then
+        key = (self.pos(), self.rotation(), self.orientation, bool(self.scene() and self.scene().views()))
+        cached = self._occupied_cells_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        cells = frozenset(self._footprint_cells(*self.get_display_grid_position()))
+        self._occupied_cells_cache = (key, cells)
+        return cells
+
+    def _footprint_cells(self, gx, gy):
+        """Cells of the eff_w x eff_h footprint anchored at (gx, gy)."""
         eff_w, eff_h = self.compute_effective_cell_dimensions()
         cells = set()
         # Fill all cells in the rectangular footprint
@@ -270,6 +270,7 @@ class MainWindow(QMainWindow):
 
         # Inspect panel (top)
         self.inspect_panel = InspectPanel()
+        self.inspect_panel.set_view(self.graphicsViewSandbox)
         self.right_splitter.addWidget(self.inspect_panel)
 
         # Simulation output panel (bottom)
@@ -766,6 +767,9 @@ class MainWindow(QMainWindow):
 
     def on_save(self):
         """Save the current project to the default projects directory"""
+        # Edits still in the inspect panel belong in the saved file
+        self.inspect_panel.flush_pending_edits()
+
         # If no current project name, ask for one
         if not self.current_project_name:
             self.current_project_name = self._prompt_for_project_name()
@@ -843,6 +847,8 @@ class MainWindow(QMainWindow):
 
     def on_save_copy(self):
         """Save a copy of the project to any location (for sharing)"""
+        self.inspect_panel.flush_pending_edits()
+
         # Show file dialog to select a location
         file_path, _ = QFileDialog.getSaveFileName(
             self,
@@ -883,6 +889,8 @@ class MainWindow(QMainWindow):
                 self.log_panel.log_message(f"[ERROR] Error saving copy: {e}")
 
     def on_run(self):
+        # Simulate what the inspect panel shows, including uncommitted edits
+        self.inspect_panel.flush_pending_edits()
         self.log_panel.log_message("[INFO] Simulation started")
 
         # Run backend simulation
@@ -1046,10 +1054,7 @@ class MainWindow(QMainWindow):
 
     def on_copy_output_clicked(self):
         """Copy simulation output to clipboard"""
-        output_text = self.sim_output_panel.get_output_text() if self.sim_output_panel else ""
-        if output_text.strip():
-            clipboard = QApplication.clipboard()
-            clipboard.setText(output_text)
+        if self.sim_output_panel and self.sim_output_panel.copy_output():
             self.log_panel.log_message("[INFO] Simulation output copied to clipboard")
         else:
             self.log_panel.log_message("[INFO] No simulation output to copy")
@@ -1160,6 +1165,8 @@ class MainWindow(QMainWindow):
 
     def on_component_selected(self, component):
         """Handle component selection"""
+        # A debounced edit still pending belongs to the previous selection
+        self.inspect_panel.flush_pending_edits()
         self.selected_component = component
         if self.component_manager:
             self.component_manager.on_component_selected(component)
@@ -1359,7 +1366,9 @@ class MainWindow(QMainWindow):
 
 
 if __name__ == '__main__':
+    from circuit_designer.ui.constants import APP_STYLESHEET
     app = QApplication(sys.argv)
+    app.setStyleSheet(APP_STYLESHEET)
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -113,13 +113,15 @@ class ComponentManager:
     def on_inspect_field_changed(self):
         """Handle changes in inspect panel fields"""
         if self.selected_component and hasattr(self.selected_component, 'component_type'):
+            inspect_panel = self.inspect_panel
+
             # Update component properties based on inspect panel values
-            if hasattr(self.inspect_panel, 'editName') and self.inspect_panel.editName.isVisible():
-                self.selected_component.name = self.inspect_panel.editName.text()
+            if inspect_panel.shows_row("name"):
+                self.selected_component.name = inspect_panel.editName.text()
 
             # Handle orientation changes from the dropdown
-            if hasattr(self.inspect_panel, 'comboOrient') and self.inspect_panel.comboOrient.isVisible():
-                current_orientation_text = self.inspect_panel.comboOrient.currentText()
+            if inspect_panel.shows_row("orientation"):
+                current_orientation_text = inspect_panel.comboOrient.currentText()
                 new_orientation = int(current_orientation_text.replace("°", ""))
 
                 # Only rotate if orientation actually changed
@@ -139,19 +141,19 @@ class ComponentManager:
 
             # Update component-specific values
             comp_type = self.selected_component.component_type
-            if comp_type == "Resistor" and hasattr(self.inspect_panel, 'editResistance'):
-                if self.inspect_panel.editResistance.isVisible():
-                    self.selected_component.value = self.inspect_panel.editResistance.text()
-            elif comp_type == "Vdc" and hasattr(self.inspect_panel, 'editVoltage'):
-                if self.inspect_panel.editVoltage.isVisible():
-                    self.selected_component.value = self.inspect_panel.editVoltage.text()
-            elif comp_type == "Switch" and hasattr(self.inspect_panel, 'comboSwitchState'):
-                if self.inspect_panel.comboSwitchState.isVisible():
-                    self.selected_component.value = self.inspect_panel.comboSwitchState.currentText()
+            if comp_type == "Resistor":
+                if inspect_panel.shows_row("resistance"):
+                    self.selected_component.value = inspect_panel.editResistance.text()
+            elif comp_type == "Vdc":
+                if inspect_panel.shows_row("voltage"):
+                    self.selected_component.value = inspect_panel.editVoltage.text()
+            elif comp_type == "Switch":
+                if inspect_panel.shows_row("switch_state"):
+                    self.selected_component.value = inspect_panel.comboSwitchState.currentText()
             elif comp_type == "LED":
                 # Update LED threshold if changed
-                if hasattr(self.inspect_panel, 'editLEDThreshold') and self.inspect_panel.editLEDThreshold.isVisible():
-                    threshold_text = self.inspect_panel.editLEDThreshold.text()
+                if inspect_panel.shows_row("led_threshold"):
+                    threshold_text = inspect_panel.editLEDThreshold.text()
                     if threshold_text:
                         # Parse threshold voltage
                         threshold_value = self.backend_simulator.parse_value(threshold_text, 'LED')
@@ -183,8 +185,9 @@ class ComponentManager:
 
     def clear_selection(self):
         """Clear component selection"""
-        self.selected_component = None
+        # The panel flushes pending edits to the still-selected component first
         self.inspect_panel.show_default_state()
+        self.selected_component = None
 
     def get_selected_component(self):
         """Get the currently selected component"""
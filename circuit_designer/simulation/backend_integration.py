@@ -14,6 +14,19 @@ except ImportError as e:
     PYSPICE_AVAILABLE = False
     PYSPICE_ERROR = str(e)
 
+# Number followed by an optional unit/prefix, matched against the uppercased value
+_VALUE_RE = re.compile(r'([0-9.]+)\s*([A-ZΩ]*)')
+
+# Metric prefixes keyed by the first letter of the unit ('M' is milli here)
+_PREFIX_MULTIPLIERS = {
+    'P': 1e-12,  # pico
+    'N': 1e-9,   # nano
+    'U': 1e-6,   # micro (µ)
+    'M': 1e-3,   # milli
+    'K': 1e3,    # kilo
+    'G': 1e9,    # giga
+}
+
 
 class BackendSimulator:
     """Integrates the PySpice backend with the circuit designer"""
@@ -50,7 +63,7 @@ class BackendSimulator:
         value_str = value_str.strip().upper()
 
         # Extract number and unit
-        match = re.match(r'([0-9.]+)\s*([A-ZΩ]*)', value_str)
+        match = _VALUE_RE.match(value_str)
         if not match:
             try:
                 return float(value_str)
@@ -61,21 +74,7 @@ class BackendSimulator:
         number = float(number_str)
 
         # Handle metric prefixes
-        multipliers = {
-            'P': 1e-12,  # pico
-            'N': 1e-9,   # nano
-            'U': 1e-6,   # micro (µ)
-            'M': 1e-3,   # milli
-            'K': 1e3,    # kilo
-            'MEG': 1e6,  # mega
-            'G': 1e9,    # giga
-        }
-
-        for prefix, mult in multipliers.items():
-            if unit.startswith(prefix):
-                return number * mult
-
-        return number
+        return number * _PREFIX_MULTIPLIERS.get(unit[:1], 1)
 
     def scene_to_grid(self, scene: QGraphicsScene, grid_spacing: float = 40) -> tuple:
         """
@@ -1,6 +1,76 @@
+import re
+from collections import defaultdict
+from weakref import WeakKeyDictionary
+
 from PyQt6.QtCore import QObject
 from circuit_designer.components import Wire
 
+# A whole value: number (optionally with exponent), optional k/m prefix ('M' is
+# milli here, as in the backend) and optional unit. Anything else is rejected.
+_VALUE_RE = re.compile(
+    r'\s*([-+]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][-+]?[0-9]+)?)'
+    r'\s*([kKmM]?)\s*(?:\u03a9|[Oo]hm|[VvAa])?\s*'
+)
+
+# (multiplier, divisor) per prefix, so milli values divide exactly like before
+_PREFIX_FACTORS = {
+    '': (1, 1),
+    'k': (1000, 1),
+    'K': (1000, 1),
+    'm': (1, 1000),
+    'M': (1, 1000),
+}
+
+# Circuit grid naming per component type:
+# component_type -> (name prefix, name of the first one or None, grid type)
+_GRID_TYPES = {
+    "GND": ("ground", None, "ground"),
+    "Voltage Source": ("voltage_source", "voltage_source", "voltage source"),
+    "Vdc": ("voltage_source", "voltage_source", "voltage source"),
+    "Resistor": ("", None, "resistor"),
+    "Current Source": ("current_source", None, "current source"),
+}
+
+# Grid values used when a value cannot be parsed, or is not set at all
+_PARSE_FAILURE_VALUES = {'voltage source': 5.0, 'resistor': 1000.0, 'current source': 0.001}
+_MISSING_VALUES = {'voltage source': 5.0, 'ground': 0, 'resistor': 1000.0}
+
+
+def _parse_value(value_str):
+    """Parse a value such as "2.2kΩ", "9V" or "20mA" into base units
+
+    Returns None when the string is not a number with an optional k/m
+    prefix and unit, so callers fall back to their defaults without going
+    through an exception.
+    """
+    if not isinstance(value_str, str):
+        return None
+    match = _VALUE_RE.fullmatch(value_str)
+    if not match:
+        # Whatever float() itself accepts (e.g. "inf", "1_000") still parses
+        try:
+            return float(value_str)
+        except ValueError:
+            return None
+    number, prefix = match.groups()
+    multiplier, divisor = _PREFIX_FACTORS[prefix]
+    return float(number) * multiplier / divisor
+
+
+# component -> (value string, parsed value); entries go away with the component
+_parsed_values = WeakKeyDictionary()
+
+
+def _component_value(comp):
+    """Parsed value (or None) of a component, cached until its value string changes"""
+    value_str = comp.value
+    cached = _parsed_values.get(comp)
+    if cached is not None and cached[0] == value_str:
+        return cached[1]
+    numeric_value = _parse_value(value_str)
+    _parsed_values[comp] = (value_str, numeric_value)
+    return numeric_value
+
 
 class SimulationEngine(QObject):
     """Handles circuit simulation and analysis"""
@@ -18,114 +88,100 @@ class SimulationEngine(QObject):
             # Generate circuit grid format
             circuit_grid = self.generate_circuit_grid(components, wires)
 
-            result = "=== CIRCUIT SIMULATION RESULTS ===\n\n"
+            # Collected in a list and joined once, not grown with +=
+            parts = ["=== CIRCUIT SIMULATION RESULTS ===\n\n"]
 
             # Add the circuit grid dictionary output
-            result += "Circuit Grid Format:\n"
-            result += "circuit_grid = {\n"
-
-            for key, value in circuit_grid.items():
-                result += f"    '{key}': {value},\n"
-
-            result += "}\n\n"
-
-            # Count components by type
-            component_counts = {}
-            voltage_sources = []
-            resistors = []
-            current_sources = []
-            grounds = []
+            parts.append("Circuit Grid Format:\n")
+            entries = "".join(f"    {key!r}: {value!r},\n" for key, value in circuit_grid.items())
+            parts.append(f"circuit_grid = {{\n{entries}}}\n\n")
 
+            # Bucket components by type in one pass; counts are the bucket sizes
+            components_by_type = defaultdict(list)
             for comp in components:
-                comp_type = comp.component_type
-                component_counts[comp_type] = component_counts.get(comp_type, 0) + 1
-
-                if comp_type in ["Voltage Source", "Vdc"]:
-                    voltage_sources.append(comp)
-                elif comp_type == "Resistor":
-                    resistors.append(comp)
-                elif comp_type == "Current Source":
-                    current_sources.append(comp)
-                elif comp_type == "GND":
-                    grounds.append(comp)
+                components_by_type[comp.component_type].append(comp)
+            component_counts = {comp_type: len(comps) for comp_type, comps in components_by_type.items()}
+
+            voltage_sources = components_by_type.get("Voltage Source", []) + components_by_type.get("Vdc", [])
+            resistors = components_by_type.get("Resistor", [])
+            current_sources = components_by_type.get("Current Source", [])
+            grounds = components_by_type.get("GND", [])
 
             # Display circuit summary
-            result += "Circuit Summary:\n"
+            parts.append("Circuit Summary:\n")
             for comp_type, count in component_counts.items():
-                result += f"  {comp_type}: {count}\n"
-            result += f"  Wires: {len(wires)}\n\n"
+                parts.append(f"  {comp_type}: {count}\n")
+            parts.append(f"  Wires: {len(wires)}\n\n")
 
             # Check for basic circuit validity
             if not grounds:
-                result += "⚠️  WARNING: No ground reference found!\n\n"
+                parts.append("⚠️  WARNING: No ground reference found!\n\n")
 
             if not voltage_sources and not current_sources:
-                result += "⚠️  WARNING: No sources found in circuit!\n\n"
+                parts.append("⚠️  WARNING: No sources found in circuit!\n\n")
 
             # Simulate basic voltage/current calculations
-            result += "Node Analysis:\n"
+            parts.append("Node Analysis:\n")
 
             if voltage_sources:
-                result += f"📊 Voltage Sources ({len(voltage_sources)}):\n"
+                parts.append(f"📊 Voltage Sources ({len(voltage_sources)}):\n")
                 for i, vs in enumerate(voltage_sources):
                     voltage = vs.value if vs.value else "0V"
-                    result += f"  V{i+1} ({vs.name}): {voltage}\n"
-                result += "\n"
+                    parts.append(f"  V{i+1} ({vs.name}): {voltage}\n")
+                parts.append("\n")
 
             if resistors:
-                result += f"🔌 Resistors ({len(resistors)}):\n"
+                parts.append(f"🔌 Resistors ({len(resistors)}):\n")
                 for i, res in enumerate(resistors):
                     resistance = res.value if res.value else "1kΩ"
                     # Simple current calculation if we have voltage sources
                     if voltage_sources:
-                        try:
-                            # Extract numeric value from voltage
-                            v_val = float(voltage_sources[0].value.replace('V', '').replace('v', '')) if voltage_sources[0].value else 5.0
-                            # Extract numeric value from resistance
-                            r_str = resistance.replace('Ω', '').replace('Ohm', '').replace('ohm', '')
-                            if 'k' in r_str.lower():
-                                r_val = float(r_str.replace('k', '').replace('K', '')) * 1000
-                            elif 'm' in r_str.lower():
-                                r_val = float(r_str.replace('m', '').replace('M', '')) / 1000
-                            else:
-                                r_val = float(r_str) if r_str else 1000
+                        # Extract numeric values from voltage and resistance
+                        v_val = _component_value(voltage_sources[0]) if voltage_sources[0].value else 5.0
+                        r_val = _component_value(res) if res.value else 1000.0
 
+                        # Unparsable values and zero resistance can't be calculated
+                        if v_val is not None and r_val:
                             current = v_val / r_val * 1000  # Convert to mA
                             power = v_val * v_val / r_val * 1000  # Convert to mW
 
-                            result += f"  R{i+1} ({res.name}): {resistance}\n"
-                            result += f"    Current: {current:.2f} mA\n"
-                            result += f"    Power: {power:.2f} mW\n"
-                        except:
-                            result += f"  R{i+1} ({res.name}): {resistance}\n"
-                            result += f"    Current: -- (calculation error)\n"
+                            parts.append(
+                                f"  R{i+1} ({res.name}): {resistance}\n"
+                                f"    Current: {current:.2f} mA\n"
+                                f"    Power: {power:.2f} mW\n"
+                            )
+                        else:
+                            parts.append(
+                                f"  R{i+1} ({res.name}): {resistance}\n"
+                                "    Current: -- (calculation error)\n"
+                            )
                     else:
-                        result += f"  R{i+1} ({res.name}): {resistance}\n"
-                result += "\n"
+                        parts.append(f"  R{i+1} ({res.name}): {resistance}\n")
+                parts.append("\n")
 
             if current_sources:
-                result += f"⚡ Current Sources ({len(current_sources)}):\n"
+                parts.append(f"⚡ Current Sources ({len(current_sources)}):\n")
                 for i, cs in enumerate(current_sources):
                     current = cs.value if cs.value else "1mA"
-                    result += f"  I{i+1} ({cs.name}): {current}\n"
-                result += "\n"
+                    parts.append(f"  I{i+1} ({cs.name}): {current}\n")
+                parts.append("\n")
 
             # Connection analysis
-            result += "Connection Analysis:\n"
+            parts.append("Connection Analysis:\n")
             if wires:
-                result += f"✅ {len(wires)} wire connections found\n"
+                parts.append(f"✅ {len(wires)} wire connections found\n")
             else:
-                result += "⚠️  No wire connections found\n"
+                parts.append("⚠️  No wire connections found\n")
 
             # Simple validation checks
             if len(components) >= 2 and len(wires) >= 1 and grounds:
-                result += "\n✅ Circuit appears to be properly connected\n"
-                result += "🔋 Simulation completed successfully"
+                parts.append("\n✅ Circuit appears to be properly connected\n")
+                parts.append("🔋 Simulation completed successfully")
             else:
-                result += "\n⚠️  Circuit may not be properly connected\n"
-                result += "💡 Add components, wires, and ground reference"
+                parts.append("\n⚠️  Circuit may not be properly connected\n")
+                parts.append("💡 Add components, wires, and ground reference")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
             return f"Simulation Error:\n{str(e)}\n\nPlease check your circuit configuration."
@@ -135,71 +191,59 @@ class SimulationEngine(QObject):
         try:
             circuit_grid = {}
 
+            # Grid coordinates of an item position, with the spacing looked up once
+            grid_spacing = self.graphics_view.grid_spacing
+
+            def to_grid(pos):
+                return int(round(pos.x() / grid_spacing)), int(round(pos.y() / grid_spacing))
+
+            # Each component is looked up again for every wire that reaches it,
+            # so its grid coordinate is computed once per call
+            item_coords = {}
+
+            def item_grid(item):
+                coord = item_coords.get(item)
+                if coord is None:
+                    coord = item_coords[item] = to_grid(item.pos())
+                return coord
+
             # Sort components for consistent naming
             components_sorted = sorted(components, key=lambda c: (c.component_type, c.pos().x(), c.pos().y()))
 
             # Track component counters for proper naming
             component_counters = {}
-            resistor_counter = 1
 
             # Process components
             for comp in components_sorted:
                 # Convert screen position to grid coordinates
-                pos = comp.pos()
-                grid_x = int(round(pos.x() / self.graphics_view.grid_spacing))
-                grid_y = int(round(pos.y() / self.graphics_view.grid_spacing))
+                grid_x, grid_y = item_grid(comp)
 
                 # Generate component name and type
                 comp_type_key = comp.component_type
-                if comp_type_key not in component_counters:
-                    component_counters[comp_type_key] = 0
-                component_counters[comp_type_key] += 1
-
-                if comp.component_type == "GND":
-                    if component_counters[comp_type_key] == 1:
-                        comp_name = "ground1"
-                    else:
-                        comp_name = f"ground{component_counters[comp_type_key]}"
-                    comp_type = "ground"
-                elif comp.component_type in ["Voltage Source", "Vdc"]:
-                    if component_counters[comp_type_key] == 1:
-                        comp_name = "voltage_source"
-                    else:
-                        comp_name = f"voltage_source{component_counters[comp_type_key]}"
-                    comp_type = "voltage source"
-                elif comp.component_type == "Resistor":
-                    comp_name = str(resistor_counter)
-                    resistor_counter += 1
-                    comp_type = "resistor"
-                elif comp.component_type == "Current Source":
-                    if component_counters[comp_type_key] == 1:
-                        comp_name = "current_source1"
-                    else:
-                        comp_name = f"current_source{component_counters[comp_type_key]}"
-                    comp_type = "current source"
+                count = component_counters.get(comp_type_key, 0) + 1
+                component_counters[comp_type_key] = count
+
+                naming = _GRID_TYPES.get(comp_type_key)
+                if naming is None:
+                    naming = ("component", None, comp_type_key.lower())
+                name_prefix, first_name, comp_type = naming
+                if count == 1 and first_name is not None:
+                    comp_name = first_name
                 else:
-                    comp_name = f"component{component_counters[comp_type_key]}"
-                    comp_type = comp.component_type.lower()
+                    comp_name = f"{name_prefix}{count}"
 
                 # Get connections - find connected components through wires
-                connections = []
-                if hasattr(comp, 'connection_points'):
-                    connected_coords = set()  # Use set to avoid duplicates
-
-                    for cp in comp.connection_points:
-                        if hasattr(cp, 'connected_wires'):
-                            for wire in cp.connected_wires:
-                                # Get the other end of the wire
-                                if hasattr(wire, 'start_point') and hasattr(wire, 'end_point'):
-                                    other_point = wire.end_point if wire.start_point == cp else wire.start_point
-                                    if hasattr(other_point, 'parentItem') and other_point.parentItem():
-                                        other_comp = other_point.parentItem()
-                                        other_pos = other_comp.pos()
-                                        other_grid_x = int(round(other_pos.x() / self.graphics_view.grid_spacing))
-                                        other_grid_y = int(round(other_pos.y() / self.graphics_view.grid_spacing))
-                                        connected_coords.add((other_grid_x, other_grid_y))
-
-                    connections = list(connected_coords)
+                # (connection points and wires follow the Wire/ConnectionPoint contract)
+                connected_coords = set()  # Use set to avoid duplicates
+                for cp in getattr(comp, 'connection_points', ()):
+                    for wire in cp.connected_wires:
+                        # Get the other end of the wire
+                        start_point = wire.start_point
+                        other_point = wire.end_point if start_point is cp else start_point
+                        other_comp = other_point.parentItem()
+                        if other_comp:
+                            connected_coords.add(item_grid(other_comp))
+                connections = list(connected_coords)
 
                 # Create component entry
                 entry = {
@@ -210,83 +254,43 @@ class SimulationEngine(QObject):
 
                 # Add value if component has one
                 if hasattr(comp, 'value') and comp.value:
-                    try:
-                        # Extract numeric value
-                        value_str = comp.value
-                        if comp_type == 'voltage source':
-                            numeric_value = float(value_str.replace('V', '').replace('v', ''))
-                        elif comp_type == 'resistor':
-                            if 'k' in value_str.lower():
-                                numeric_value = float(value_str.replace('\u03a9', '').replace('k', '').replace('K', '')) * 1000
-                            elif 'm' in value_str.lower():
-                                numeric_value = float(value_str.replace('\u03a9', '').replace('m', '').replace('M', '')) / 1000
-                            else:
-                                numeric_value = float(value_str.replace('\u03a9', '').replace('Ohm', '').replace('ohm', ''))
-                        elif comp_type == 'current source':
-                            if 'm' in value_str.lower():
-                                numeric_value = float(value_str.replace('A', '').replace('a', '').replace('m', '').replace('M', '')) / 1000
-                            else:
-                                numeric_value = float(value_str.replace('A', '').replace('a', ''))
-                        else:
-                            numeric_value = 0
+                    # Extract numeric value
+                    if comp_type in ('voltage source', 'resistor', 'current source'):
+                        numeric_value = _component_value(comp)
+                    else:
+                        numeric_value = 0
 
+                    if numeric_value is not None:
                         entry['value'] = numeric_value
-                    except:
+                    elif comp_type in _PARSE_FAILURE_VALUES:
                         # Default values if parsing fails
-                        if comp_type == 'voltage source':
-                            entry['value'] = 5.0
-                        elif comp_type == 'resistor':
-                            entry['value'] = 1000.0
-                        elif comp_type == 'current source':
-                            entry['value'] = 0.001
+                        entry['value'] = _PARSE_FAILURE_VALUES[comp_type]
                 else:
                     # Add default values for components without explicit values
-                    if comp_type == 'voltage source':
-                        entry['value'] = 5.0
-                    elif comp_type == 'ground':
-                        entry['value'] = 0
-                    elif comp_type == 'resistor':
-                        entry['value'] = 1000.0
+                    if comp_type in _MISSING_VALUES:
+                        entry['value'] = _MISSING_VALUES[comp_type]
 
                 circuit_grid[comp_name] = entry
 
             # Process wires - use actual wire positions and connections
             wire_count = 1
             for wire in wires:
-                if hasattr(wire, 'start_point') and hasattr(wire, 'end_point'):
+                # Get actual connections from wire endpoints
+                start_comp = wire.start_point.parentItem()
+                end_comp = wire.end_point.parentItem()
+
+                # Only add wire if both ends sit on a component
+                if start_comp and end_comp:
                     # Get wire position from actual wire coordinates
-                    line = wire.line()
-                    wire_x = int(round(line.x1() / self.graphics_view.grid_spacing))
-                    wire_y = int(round(line.y1() / self.graphics_view.grid_spacing))
-
-                    # Get actual connections from wire endpoints
-                    connections = []
-
-                    # Start point connection
-                    if hasattr(wire.start_point, 'parentItem') and wire.start_point.parentItem():
-                        start_comp = wire.start_point.parentItem()
-                        start_pos = start_comp.pos()
-                        start_grid_x = int(round(start_pos.x() / self.graphics_view.grid_spacing))
-                        start_grid_y = int(round(start_pos.y() / self.graphics_view.grid_spacing))
-                        connections.append((start_grid_x, start_grid_y))
-
-                    # End point connection
-                    if hasattr(wire.end_point, 'parentItem') and wire.end_point.parentItem():
-                        end_comp = wire.end_point.parentItem()
-                        end_pos = end_comp.pos()
-                        end_grid_x = int(round(end_pos.x() / self.graphics_view.grid_spacing))
-                        end_grid_y = int(round(end_pos.y() / self.graphics_view.grid_spacing))
-                        connections.append((end_grid_x, end_grid_y))
-
-                    # Only add wire if it has valid connections
-                    if len(connections) == 2:
-                        wire_name = f"wire{wire_count}"
-                        circuit_grid[wire_name] = {
-                            'coordinate': (wire_x, wire_y),
-                            'type': 'wire',
-                            'connections': connections
-                        }
-                        wire_count += 1
+                    wire_x, wire_y = to_grid(wire.line().p1())
+
+                    wire_name = f"wire{wire_count}"
+                    circuit_grid[wire_name] = {
+                        'coordinate': (wire_x, wire_y),
+                        'type': 'wire',
+                        'connections': [item_grid(start_comp), item_grid(end_comp)]
+                    }
+                    wire_count += 1
 
             return circuit_grid
 
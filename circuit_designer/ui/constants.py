@@ -27,6 +27,54 @@ COMPONENT_BORDER_WIDTH = 2
 COMPONENT_SELECTED_COLOR = (255, 0, 0)
 COMPONENT_SELECTED_WIDTH = 3
 
+# Application-wide stylesheet, installed once on the QApplication
+APP_STYLESHEET = """
+    #InspectPanel {
+        margin: 0px;
+        padding: 10px;
+    }
+    #InspectPanel::title {
+        subcontrol-origin: margin;
+        left: 6px;
+        padding: 0px 2px 2px 2px;
+        margin: 0px;
+    }
+    #InspectPanel QLineEdit,
+    #InspectPanel QComboBox {
+        margin: 0px;
+        padding: 1px 3px;
+        font-size: 12px;
+    }
+    #InspectPanel QLabel[role="netid"] {
+        font-family: monospace;
+        color: #0066cc;
+    }
+    #InspectPanel QPlainTextEdit {
+        margin: 2px 0 0 0;
+        padding: 2px;
+        font-size: 12px;
+    }
+    #InspectPanel QPushButton {
+        margin: 2px 0 0 0;
+        padding: 2px 6px;
+        font-size: 12px;
+    }
+    #SimulationOutputPanel QLabel {
+        margin: 0;
+        padding: 0;
+    }
+    #SimulationOutputPanel QTextBrowser {
+        margin: 2px 0 0 0;
+        padding: 2px;
+        font-size: 12px;
+    }
+    #SimulationOutputPanel QPushButton {
+        margin: 2px 0 0 0;
+        padding: 2px 6px;
+        font-size: 12px;
+    }
+"""
+
 # Connection points
 CONNECTION_POINT_RADIUS = 5
 CONNECTION_POINT_IN_COLOR = (0, 150, 0)  # Green for input
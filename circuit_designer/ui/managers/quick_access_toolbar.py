@@ -1,8 +1,11 @@
 """Quick Access Toolbar with customizable pinned actions"""
 
+import json
+from bisect import bisect_right
+
 from PyQt6.QtWidgets import QToolBar, QWidgetAction, QWidget, QHBoxLayout, QLabel, QToolButton, QStyle, QMenu, QApplication
-from PyQt6.QtCore import QSettings, pyqtSignal, Qt, QMimeData, QByteArray, QPoint, QPointF
-from PyQt6.QtGui import QAction, QIcon, QDrag, QPainter, QPen, QColor, QPixmap, QPolygonF
+from PyQt6.QtCore import QEvent, QSettings, QTimer, pyqtSignal, Qt, QMimeData, QByteArray, QPoint, QPointF, QRect
+from PyQt6.QtGui import QAction, QIcon, QDrag, QPainter, QPalette, QPen, QColor, QPixmap, QPolygonF
 
 
 class QuickAccessToolbar(QToolBar):
@@ -11,6 +14,9 @@ class QuickAccessToolbar(QToolBar):
     # Default pinned actions
     DEFAULT_PINNED = ["New", "Open", "Save", "Run", "Undo", "Redo"]
 
+    # Button events the drag-to-reorder filter acts on
+    DRAG_EVENT_TYPES = frozenset((QEvent.Type.MouseButtonPress, QEvent.Type.MouseMove))
+
     def __init__(self, parent=None):
         super().__init__("Quick Access", parent)
         self.setObjectName("QuickAccessToolbar")
@@ -19,84 +25,156 @@ class QuickAccessToolbar(QToolBar):
         # Dictionary to store all available actions
         self.available_actions = {}
 
+        # Actions currently on the toolbar, and their buttons, by action name
+        self._toolbar_actions = {}
+        self._toolbar_buttons = {}
+
         # Load pinned action names
         self.pinned_actions = self.load_pinned_actions()
+        # Membership view of pinned_actions; every menu row asks is_pinned()
+        self._pinned_set = set(self.pinned_actions)
+
+        # Pin/unpin/reorder bursts are written to settings once they settle
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._write_pinned_actions)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_pinned_actions)
 
         # Enable drag and drop
         self.setAcceptDrops(True)
         self.drag_start_position = None
         self.drop_indicator_pos = None  # Position to draw drop indicator
+        # Drag pixmaps by action name, grabbed on a button's first drag
+        self._drag_pixmap_cache = {}
+        # Drag a small icon instead of a button grab (slow compositors)
+        self._fast_drag_mode = (
+            self.settings.value("quick_access/fast_drag", False, type=bool)
+            or QApplication.platformName() == "wayland"
+        )
+        # Button spans (left, right, center_x, name) snapshotted for one drag
+        self._drag_geom = []
+        self._drag_lefts = []
 
     def load_pinned_actions(self):
         """Load pinned actions from settings"""
+        raw = self.settings.value("quick_access/pinned_json", None)
+        if raw:
+            try:
+                pinned = json.loads(raw)
+            except (TypeError, ValueError):
+                pinned = None
+            if isinstance(pinned, list):
+                return pinned
+
+        # Migrate the old per-element list key, if present
         pinned = self.settings.value("quick_access/pinned", self.DEFAULT_PINNED)
+        if self.settings.contains("quick_access/pinned"):
+            self.settings.remove("quick_access/pinned")
+            if isinstance(pinned, list):
+                self.settings.setValue("quick_access/pinned_json", json.dumps(pinned))
         if not isinstance(pinned, list):
             pinned = self.DEFAULT_PINNED
         return pinned
 
     def save_pinned_actions(self):
-        """Save pinned actions to settings"""
-        self.settings.setValue("quick_access/pinned", self.pinned_actions)
+        """Schedule saving pinned actions to settings"""
+        self._save_timer.start()
+
+    def _write_pinned_actions(self):
+        # One JSON string is a single store write, not one per element
+        self.settings.setValue("quick_access/pinned_json", json.dumps(self.pinned_actions))
+
+    def _flush_pinned_actions(self):
+        """Write a still pending save right away (on quit)"""
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self._write_pinned_actions()
 
     def register_action(self, action, name):
         """Register an action that can be pinned"""
         self.available_actions[name] = action
 
         # If this action is pinned, add it to toolbar
-        if name in self.pinned_actions:
+        if name in self._pinned_set:
             self.add_action_to_toolbar(action, name)
 
     def add_action_to_toolbar(self, action, name):
         """Add an action to the toolbar"""
         # Don't add if already present
-        for toolbar_action in self.actions():
-            if toolbar_action.data() == name:
-                return
-
-        # Clone the action for the toolbar
-        toolbar_action = QAction(action.icon(), action.text(), self)
-        toolbar_action.setToolTip(action.toolTip() + "\n(Drag to reorder)")
-        toolbar_action.setShortcut(action.shortcut())
-        toolbar_action.setData(name)  # Store name for identification
-
-        # Connect to same slot
-        toolbar_action.triggered.connect(action.trigger)
+        if name in self._toolbar_actions:
+            return
 
-        self.addAction(toolbar_action)
+        # Add the action itself; a QAction can live on several widgets, and
+        # a copy would keep a stale shortcut once the original is remapped
+        self.addAction(action)
+        self._toolbar_actions[name] = action
+        self._setup_action_button(action, name)
 
-        # Get the button widget created for this action and make it draggable
+    def _setup_action_button(self, toolbar_action, name):
+        """Make the button QToolBar created for toolbar_action draggable"""
         button = self.widgetForAction(toolbar_action)
         if button:
-            button.setAcceptDrops(True)
+            self._toolbar_buttons[name] = button
+            button.setToolTip(toolbar_action.toolTip() + "\n(Drag to reorder)")
             # Store action name in button for later retrieval
             button.setProperty("action_name", name)
             # Install event filter to intercept mouse events
             button.installEventFilter(self)
 
+    def _move_action_in_toolbar(self, name):
+        """Move an action's button to its position in pinned_actions"""
+        toolbar_action = self._toolbar_actions.get(name)
+        if toolbar_action is None:
+            self.rebuild_toolbar()
+            return
+
+        # Insert before the next pinned action that is on the toolbar
+        index = self.pinned_actions.index(name)
+        before = None
+        for next_name in self.pinned_actions[index + 1:]:
+            before = self._toolbar_actions.get(next_name)
+            if before is not None:
+                break
+
+        self.removeAction(toolbar_action)
+        self.insertAction(before, toolbar_action)
+        # QToolBar made a new button for the re-inserted action
+        self._setup_action_button(toolbar_action, name)
+
     def remove_action_from_toolbar(self, name):
         """Remove an action from the toolbar"""
-        for action in self.actions():
-            if action.data() == name:
-                self.removeAction(action)
-                break
+        toolbar_action = self._toolbar_actions.pop(name, None)
+        self._toolbar_buttons.pop(name, None)
+        self.invalidate_pixmap(name)
+        if toolbar_action is not None:
+            self.removeAction(toolbar_action)
+
+    def invalidate_pixmap(self, name):
+        """Drop the cached drag pixmap of an action, e.g. after its icon changed"""
+        self._drag_pixmap_cache.pop(name, None)
 
     def pin_action(self, name):
         """Pin an action to the toolbar"""
-        if name not in self.pinned_actions and name in self.available_actions:
+        if name not in self._pinned_set and name in self.available_actions:
             self.pinned_actions.append(name)
+            self._pinned_set.add(name)
             self.save_pinned_actions()
             self.add_action_to_toolbar(self.available_actions[name], name)
 
     def unpin_action(self, name):
         """Unpin an action from the toolbar"""
-        if name in self.pinned_actions:
+        if name in self._pinned_set:
             self.pinned_actions.remove(name)
+            self._pinned_set.discard(name)
             self.save_pinned_actions()
             self.remove_action_from_toolbar(name)
 
     def is_pinned(self, name):
         """Check if an action is pinned"""
-        return name in self.pinned_actions
+        return name in self._pinned_set
 
     def toggle_pin(self, name):
         """Toggle pin state of an action"""
@@ -107,59 +185,96 @@ class QuickAccessToolbar(QToolBar):
 
     def rebuild_toolbar(self):
         """Rebuild the entire toolbar from pinned actions"""
-        # Clear toolbar
-        self.clear()
-
-        # Re-add all pinned actions in order
-        for name in self.pinned_actions:
-            if name in self.available_actions:
-                self.add_action_to_toolbar(self.available_actions[name], name)
+        # One repaint for the whole rebuild instead of one per action
+        self.setUpdatesEnabled(False)
+        try:
+            # Clear toolbar (removes the actions, they stay registered)
+            self.clear()
+            self._toolbar_actions.clear()
+            self._toolbar_buttons.clear()
+
+            # Re-add all pinned actions in order
+            for name in self.pinned_actions:
+                if name in self.available_actions:
+                    self.add_action_to_toolbar(self.available_actions[name], name)
+        finally:
+            self.setUpdatesEnabled(True)
 
     def eventFilter(self, watched, event):
         """Filter events from toolbar buttons to handle dragging"""
-        # Check if this is a button with an action name
-        if hasattr(watched, 'property'):
-            action_name = watched.property("action_name")
-            if action_name:
-                # Handle mouse press
-                if event.type() == event.Type.MouseButtonPress:
-                    if event.button() == Qt.MouseButton.LeftButton:
-                        self.drag_start_position = event.pos()
-                        self.dragged_action_name = action_name
-                        self.dragged_button = watched
-                        return False  # Let the event continue
-
-                # Handle mouse move
-                elif event.type() == event.Type.MouseMove:
-                    if (event.buttons() & Qt.MouseButton.LeftButton) and \
-                       hasattr(self, 'drag_start_position') and self.drag_start_position is not None:
-
-                        # Check if we've moved far enough to start a drag
-                        if (event.pos() - self.drag_start_position).manhattanLength() >= 10:
-                            # Start drag operation
-                            drag = QDrag(watched)
-                            mime_data = QMimeData()
-                            mime_data.setText(action_name)
-                            drag.setMimeData(mime_data)
-
-                            # Create a pixmap of the button being dragged
-                            pixmap = watched.grab()
+        # Buttons see every paint/hover/tooltip event; only presses and moves matter
+        if event.type() not in self.DRAG_EVENT_TYPES:
+            return super().eventFilter(watched, event)
+
+        # Only buttons set up by _setup_action_button carry an action name
+        action_name = watched.property("action_name")
+        if action_name:
+            # Handle mouse press
+            if event.type() == event.Type.MouseButtonPress:
+                if event.button() == Qt.MouseButton.LeftButton:
+                    self.drag_start_position = event.pos()
+                    self.dragged_action_name = action_name
+                    self.dragged_button = watched
+                    return False  # Let the event continue
+
+            # Handle mouse move
+            elif event.type() == event.Type.MouseMove:
+                if (event.buttons() & Qt.MouseButton.LeftButton) and \
+                   self.drag_start_position is not None:
+
+                    # Check if we've moved far enough to start a drag
+                    if (event.pos() - self.drag_start_position).manhattanLength() >= 10:
+                        # Start drag operation
+                        drag = QDrag(watched)
+                        mime_data = QMimeData()
+                        mime_data.setText(action_name)
+                        drag.setMimeData(mime_data)
+
+                        if self._fast_drag_mode:
+                            # Just the action's icon, or its text when it has none
+                            icon = self._toolbar_actions[action_name].icon()
+                            if icon.isNull():
+                                pixmap = self._text_drag_pixmap(watched)
+                            else:
+                                pixmap = icon.pixmap(16, 16)
+                        else:
+                            # Pixmap of the button being dragged, grabbed once
+                            pixmap = self._drag_pixmap_cache.get(action_name)
+                            if pixmap is None:
+                                pixmap = watched.grab()
+                                self._drag_pixmap_cache[action_name] = pixmap
+                        if not pixmap.isNull():
                             drag.setPixmap(pixmap)
                             drag.setHotSpot(pixmap.rect().center())
 
-                            # Clear drag start position
-                            self.drag_start_position = None
+                        # Clear drag start position
+                        self.drag_start_position = None
 
-                            # Execute drag
-                            drag.exec(Qt.DropAction.MoveAction)
-                            return True  # Event handled
+                        # Execute drag
+                        drag.exec(Qt.DropAction.MoveAction)
+                        return True  # Event handled
 
         return super().eventFilter(watched, event)
 
+    def _text_drag_pixmap(self, button):
+        """The button's text on a plain rect, a drag image that needs no grab"""
+        metrics = button.fontMetrics()
+        text = button.text()
+        pixmap = QPixmap(metrics.horizontalAdvance(text) + 12, metrics.height() + 6)
+        palette = button.palette()
+        pixmap.fill(palette.color(QPalette.ColorRole.Button))
+        painter = QPainter(pixmap)
+        painter.setFont(button.font())
+        painter.setPen(palette.color(QPalette.ColorRole.ButtonText))
+        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.end()
+        return pixmap
+
     def dragEnterEvent(self, event):
         """Accept drag events with text data"""
         if event.mimeData().hasText():
             event.acceptProposedAction()
+            self._snapshot_drag_geometry()
 
     def dragMoveEvent(self, event):
         """Accept drag move events and show drop indicator"""
@@ -167,54 +282,54 @@ class QuickAccessToolbar(QToolBar):
             event.acceptProposedAction()
 
             # Calculate drop indicator position
-            drop_pos = event.position().toPoint()
-            target_button = self.childAt(drop_pos)
-
-            if not target_button or not hasattr(target_button, 'property'):
-                target_button = self._find_closest_button(drop_pos)
-
-            if target_button and hasattr(target_button, 'property'):
-                target_name = target_button.property("action_name")
-                if target_name:
-                    # Get the center X of the target button
-                    target_center_x = target_button.x() + target_button.width() / 2
-                    drop_x = drop_pos.x()
-
-                    # Determine if indicator should be on left or right
-                    if drop_x <= target_center_x:
-                        # Insert before - show line on left edge
-                        self.drop_indicator_pos = target_button.x()
-                    else:
-                        # Insert after - show line on right edge
-                        self.drop_indicator_pos = target_button.x() + target_button.width()
-
-                    self.update()  # Trigger repaint
+            drop_x = event.position().toPoint().x()
+            target = self._drop_target(drop_x)
+
+            if target is not None:
+                left, right, target_center_x, _ = target
+
+                # Determine if indicator should be on left or right
+                if drop_x <= target_center_x:
+                    # Insert before - show line on left edge
+                    self._set_drop_indicator(left)
+                else:
+                    # Insert after - show line on right edge
+                    self._set_drop_indicator(right)
         else:
-            self.drop_indicator_pos = None
-            self.update()
+            self._set_drop_indicator(None)
+
+    def _set_drop_indicator(self, pos):
+        """Move the drop indicator, repainting only the strips it leaves and enters"""
+        old_pos = self.drop_indicator_pos
+        if pos == old_pos:
+            return
+
+        self.drop_indicator_pos = pos
+        for strip_x in (old_pos, pos):
+            if strip_x is not None:
+                # The indicator is a 3px line, so a 5px strip covers it
+                self.update(QRect(int(strip_x) - 2, 0, 5, self.height()))
 
     def dropEvent(self, event):
         """Handle drop event to reorder buttons horizontally"""
         # Clear drop indicator
-        self.drop_indicator_pos = None
-        self.update()
+        self._set_drop_indicator(None)
 
         if not event.mimeData().hasText():
+            self._clear_drag_geometry()
             return
 
         dragged_name = event.mimeData().text()
-        drop_pos = event.position().toPoint()
+        drop_x = event.position().toPoint().x()
 
-        # Find the button at the drop position
-        target_button = self.childAt(drop_pos)
-        if not target_button or not hasattr(target_button, 'property'):
-            # If not dropped on a button, try to find the closest button
-            target_button = self._find_closest_button(drop_pos)
+        # Find the button at (or closest to) the drop position
+        target = self._drop_target(drop_x)
+        self._clear_drag_geometry()
 
-        if target_button and hasattr(target_button, 'property'):
-            target_name = target_button.property("action_name")
+        if target is not None:
+            _, _, target_center_x, target_name = target
 
-            if target_name and target_name != dragged_name:
+            if target_name != dragged_name:
                 # Reorder the pinned_actions list
                 try:
                     # Remove the dragged action from its current position
@@ -224,11 +339,6 @@ class QuickAccessToolbar(QToolBar):
                     # Find new position
                     new_index = self.pinned_actions.index(target_name)
 
-                    # Determine if we should insert before or after target based on position
-                    # Get the center X of the target button
-                    target_center_x = target_button.x() + target_button.width() / 2
-                    drop_x = drop_pos.x()
-
                     # If dropped on the right half of target, insert after
                     if drop_x > target_center_x:
                         new_index += 1
@@ -236,9 +346,9 @@ class QuickAccessToolbar(QToolBar):
                     # Insert at new position
                     self.pinned_actions.insert(new_index, dragged_name)
 
-                    # Save and rebuild
+                    # Save and move just the dragged button
                     self.save_pinned_actions()
-                    self.rebuild_toolbar()
+                    self._move_action_in_toolbar(dragged_name)
 
                     event.acceptProposedAction()
                 except (ValueError, IndexError):
@@ -246,8 +356,8 @@ class QuickAccessToolbar(QToolBar):
 
     def dragLeaveEvent(self, event):
         """Clear drop indicator when drag leaves toolbar"""
-        self.drop_indicator_pos = None
-        self.update()
+        self._set_drop_indicator(None)
+        self._clear_drag_geometry()
 
     def paintEvent(self, event):
         """Draw drop indicator line"""
@@ -267,33 +377,44 @@ class QuickAccessToolbar(QToolBar):
             )
             painter.end()
 
-    def _find_closest_button(self, pos):
-        """Find the closest button to the given position"""
-        closest_button = None
-        min_distance = float('inf')
-
-        for action in self.actions():
-            button = self.widgetForAction(action)
-            if button and hasattr(button, 'property'):
-                action_name = button.property("action_name")
-                if action_name:
-                    # Calculate distance to button center
-                    button_center = QPoint(
-                        button.x() + button.width() // 2,
-                        button.y() + button.height() // 2
-                    )
-                    distance = (pos - button_center).manhattanLength()
-
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_button = button
-
-        return closest_button
+    def _snapshot_drag_geometry(self):
+        """Record the button spans once per drag, sorted left to right"""
+        geom = []
+        for name, button in self._toolbar_buttons.items():
+            left = button.x()
+            width = button.width()
+            geom.append((left, left + width, left + width / 2, name))
+        geom.sort()
+        self._drag_geom = geom
+        self._drag_lefts = [span[0] for span in geom]
+
+    def _clear_drag_geometry(self):
+        self._drag_geom = []
+        self._drag_lefts = []
+
+    def _drop_target(self, x):
+        """Return the (left, right, center_x, name) span a drop at x targets"""
+        if not self._drag_geom:
+            self._snapshot_drag_geometry()
+        geom = self._drag_geom
+        if not geom:
+            return None
+
+        # The button under x, if any
+        index = bisect_right(self._drag_lefts, x) - 1
+        if index >= 0 and x < geom[index][1]:
+            return geom[index]
+
+        # Otherwise the closer of the neighbouring buttons
+        return min(geom[max(index, 0):index + 2], key=lambda span: abs(span[2] - x))
 
 
 class PinnableMenuAction(QWidgetAction):
     """A menu action with a pin button"""
 
+    # Pin icons drawn so far, keyed by pinned state (shared by all rows)
+    _pin_icons = {}
+
     def __init__(self, action, name, toolbar, parent=None):
         super().__init__(parent)
         self.action = action
@@ -374,14 +495,21 @@ class PinnableMenuAction(QWidgetAction):
         p.end()
         return QIcon(pm)
 
+    def _pin_icon(self, pinned: bool) -> QIcon:
+        """Pin icon for the given state, drawn once and then reused"""
+        icon = self._pin_icons.get(pinned)
+        if icon is None:
+            icon = self._pin_icons[pinned] = self._make_pin_icon(pinned)
+        return icon
+
     def update_pin_button(self):
         """Update pin button appearance"""
         self.pin_button.setText("")  # Clear any text
         if self.toolbar.is_pinned(self.name):
-            self.pin_button.setIcon(self._make_pin_icon(True))
+            self.pin_button.setIcon(self._pin_icon(True))
             self.pin_button.setToolTip("Unpin from toolbar")
         else:
-            self.pin_button.setIcon(self._make_pin_icon(False))
+            self.pin_button.setIcon(self._pin_icon(False))
             self.pin_button.setToolTip("Pin to toolbar")
 
     def toggle_pin(self):
@@ -391,25 +519,53 @@ class PinnableMenuAction(QWidgetAction):
 
     def trigger_action(self):
         """Trigger the original action"""
-        # Find and close the parent menu
-        parent = self.parent()
-        if parent:
-            # Walk up the widget tree to find the QMenu
-            widget = parent
-            while widget:
-                if isinstance(widget, QMenu):
-                    widget.close()
-                    break
-                widget = widget.parentWidget()
+        # Close the owning menu (make_menu_pinnable parents the action to it)
+        menu = self.parent()
+        if isinstance(menu, QMenu):
+            menu.close()
 
         # Trigger the action
         self.action.trigger()
 
 
+class _PendingPinnable:
+    """Pinnable entries of a menu that has not been shown yet
+
+    Stored on the menu itself (so it goes away with it) and added to the
+    menu by its first aboutToShow, after which the slot is disconnected.
+    """
+
+    PROPERTY = "pinnable_pending"
+
+    def __init__(self, menu):
+        self.entries = []  # (index, action, name, toolbar)
+        self.connection = menu.aboutToShow.connect(lambda: self.materialize(menu))
+        menu.setProperty(self.PROPERTY, self)
+
+    def materialize(self, menu):
+        """Add the pending pinnable actions to the menu at their positions"""
+        menu.aboutToShow.disconnect(self.connection)
+        menu.setProperty(self.PROPERTY, None)
+
+        for index, action, name, toolbar in self.entries:
+            # Create pinnable action
+            pinnable_action = PinnableMenuAction(action, name, toolbar, menu)
+
+            # Add to menu
+            actions = menu.actions()
+            before = actions[index] if index < len(actions) else None
+            menu.insertAction(before, pinnable_action)
+
+
 def make_menu_pinnable(menu, toolbar, action, name):
-    """Make a menu action pinnable by adding a pin button"""
-    # Create pinnable action
-    pinnable_action = PinnableMenuAction(action, name, toolbar, menu)
+    """Make a menu action pinnable by adding a pin button
+
+    QMenu builds a QWidgetAction's widget as soon as it is added, so the
+    pinnable action is only added when the menu is first about to show.
+    """
+    pending = menu.property(_PendingPinnable.PROPERTY)
+    if pending is None:
+        pending = _PendingPinnable(menu)
 
-    # Add to menu
-    menu.addAction(pinnable_action)
+    # Remember where the entry goes among the separators added meanwhile
+    pending.entries.append((len(menu.actions()) + len(pending.entries), action, name, toolbar))
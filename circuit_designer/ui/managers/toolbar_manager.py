@@ -30,6 +30,37 @@ class ToolbarManager(QObject):
     center_view_requested = pyqtSignal()
     export_png_requested = pyqtSignal()
 
+    # Quick access toolbar actions, in registration order:
+    # (attribute, text, shortcut, tooltip, signal, quick access name)
+    TOOLBAR_ACTIONS = (
+        ("actionNieuw", "New", QKeySequence.StandardKey.New, "New project (Ctrl+N)", "new_requested", "New"),
+        ("actionOpenen", "Open", QKeySequence.StandardKey.Open, "Open project (Ctrl+O)", "open_requested", "Open"),
+        ("actionOpslaan", "Save", QKeySequence.StandardKey.Save, "Save project (Ctrl+S)", "save_requested", "Save"),
+        ("actionSaveCopy", "Save Copy", "Ctrl+Shift+S", "Save a copy to any location (Ctrl+Shift+S)",
+         "save_copy_requested", "Save Copy"),
+        ("actionUndo", "Undo", QKeySequence.StandardKey.Undo, "Undo last action (Ctrl+Z)", "undo_requested", "Undo"),
+        ("actionRedo", "Redo", QKeySequence.StandardKey.Redo, "Redo last undone action (Ctrl+Shift+Z)",
+         "redo_requested", "Redo"),
+        ("actionRun", "Run", "F5", "Start simulation (F5)", "run_requested", "Run"),
+    )
+
+    # Window-wide shortcut actions, also offered on the quick access toolbar:
+    # (attribute, text, shortcut, signal, quick access name)
+    SHORTCUT_ACTIONS = (
+        ("actionCopy", "Copy", QKeySequence.StandardKey.Copy, "copy_requested", "Copy"),
+        ("actionPaste", "Paste", QKeySequence.StandardKey.Paste, "paste_requested", "Paste"),
+        ("actionCopyOutput", "Copy Output", "Ctrl+Shift+C", "copy_output_requested", "Copy Output"),
+        ("actionSelectAll", "Select All", QKeySequence.StandardKey.SelectAll, "select_all_requested", "Select All"),
+        ("actionDeselectAll", "Deselect All", "Ctrl+D", "deselect_all_requested", "Deselect All"),
+        ("actionFocusCanvas", "Focus Canvas", "F1", "focus_canvas_requested", "Focus Canvas"),
+        ("actionClearLog", "Clear Log", "Ctrl+L", "clear_log_requested", "Clear Log"),
+        ("actionZoomIn", "Zoom In", "Ctrl+=", "zoom_in_requested", "Zoom In"),
+        ("actionZoomOut", "Zoom Out", "Ctrl+-", "zoom_out_requested", "Zoom Out"),
+        ("actionZoomReset", "Reset Zoom", "Ctrl+0", "zoom_reset_requested", "Reset Zoom"),
+        ("actionCenterView", "Center View", "Home", "center_view_requested", "Center View"),
+        ("actionExportPNG", "Export as PNG", "Ctrl+E", "export_png_requested", "Export PNG"),
+    )
+
     def __init__(self, main_window):
         super().__init__()
         self.main_window = main_window
@@ -42,136 +73,29 @@ class ToolbarManager(QObject):
         self.toolbar = QuickAccessToolbar()
         self.main_window.addToolBar(self.toolbar)
 
-        # Create toolbar actions with keyboard shortcuts
-        self.actionNieuw = QAction("New", self.main_window)
-        self.actionNieuw.setShortcut(QKeySequence.StandardKey.New)
-        self.actionNieuw.setToolTip("New project (Ctrl+N)")
-
-        self.actionOpenen = QAction("Open", self.main_window)
-        self.actionOpenen.setShortcut(QKeySequence.StandardKey.Open)
-        self.actionOpenen.setToolTip("Open project (Ctrl+O)")
-
-        self.actionOpslaan = QAction("Save", self.main_window)
-        self.actionOpslaan.setShortcut(QKeySequence.StandardKey.Save)
-        self.actionOpslaan.setToolTip("Save project (Ctrl+S)")
-
-        self.actionSaveCopy = QAction("Save Copy", self.main_window)
-        self.actionSaveCopy.setShortcut(QKeySequence("Ctrl+Shift+S"))
-        self.actionSaveCopy.setToolTip("Save a copy to any location (Ctrl+Shift+S)")
-
-        self.actionRun = QAction("Run", self.main_window)
-        self.actionRun.setShortcut(QKeySequence("F5"))
-        self.actionRun.setToolTip("Start simulation (F5)")
-
-        # Undo/Redo actions
-        self.actionUndo = QAction("Undo", self.main_window)
-        self.actionUndo.setShortcut(QKeySequence.StandardKey.Undo)
-        self.actionUndo.setToolTip("Undo last action (Ctrl+Z)")
-
-        self.actionRedo = QAction("Redo", self.main_window)
-        self.actionRedo.setShortcut(QKeySequence.StandardKey.Redo)
-        self.actionRedo.setToolTip("Redo last undone action (Ctrl+Shift+Z)")
-
-        # Connect actions to signals
-        self.actionNieuw.triggered.connect(self.new_requested.emit)
-        self.actionOpenen.triggered.connect(self.open_requested.emit)
-        self.actionOpslaan.triggered.connect(self.save_requested.emit)
-        self.actionSaveCopy.triggered.connect(self.save_copy_requested.emit)
-        self.actionUndo.triggered.connect(self.undo_requested.emit)
-        self.actionRedo.triggered.connect(self.redo_requested.emit)
-        self.actionRun.triggered.connect(self.run_requested.emit)
-
-        # Register actions with quick access toolbar
-        # Default pinned: New, Open, Save, Run, Undo, Redo
-        self.toolbar.register_action(self.actionNieuw, "New")
-        self.toolbar.register_action(self.actionOpenen, "Open")
-        self.toolbar.register_action(self.actionOpslaan, "Save")
-        self.toolbar.register_action(self.actionSaveCopy, "Save Copy")
-        self.toolbar.register_action(self.actionUndo, "Undo")
-        self.toolbar.register_action(self.actionRedo, "Redo")
-        self.toolbar.register_action(self.actionRun, "Run")
+        # Create toolbar actions with keyboard shortcuts and register them
+        # with the quick access toolbar (default pinned: New, Open, Save, Run, Undo, Redo)
+        register = self.toolbar.register_action
+        for attr, text, shortcut, tooltip, signal, name in self.TOOLBAR_ACTIONS:
+            action = self._make_action(attr, text, shortcut, signal)
+            action.setToolTip(tooltip)
+            register(action, name)
+
+    def _make_action(self, attr, text, shortcut, signal):
+        """Create a main window action that emits the given signal, stored as self.<attr>"""
+        action = QAction(text, self.main_window)
+        action.setShortcut(QKeySequence(shortcut))
+        action.triggered.connect(getattr(self, signal).emit)
+        setattr(self, attr, action)
+        return action
 
     def setup_additional_shortcuts(self):
         """Setup additional keyboard shortcuts"""
-        # Copy/Paste shortcuts
-        self.actionCopy = QAction("Copy", self.main_window)
-        self.actionCopy.setShortcut(QKeySequence.StandardKey.Copy)
-        self.actionCopy.triggered.connect(self.copy_requested.emit)
-        self.main_window.addAction(self.actionCopy)
-
-        self.actionPaste = QAction("Paste", self.main_window)
-        self.actionPaste.setShortcut(QKeySequence.StandardKey.Paste)
-        self.actionPaste.triggered.connect(self.paste_requested.emit)
-        self.main_window.addAction(self.actionPaste)
-
-        # Copy output shortcut
-        self.actionCopyOutput = QAction("Copy Output", self.main_window)
-        self.actionCopyOutput.setShortcut(QKeySequence("Ctrl+Shift+C"))
-        self.actionCopyOutput.triggered.connect(self.copy_output_requested.emit)
-        self.main_window.addAction(self.actionCopyOutput)
-
-        # Select All shortcut
-        self.actionSelectAll = QAction("Select All", self.main_window)
-        self.actionSelectAll.setShortcut(QKeySequence.StandardKey.SelectAll)
-        self.actionSelectAll.triggered.connect(self.select_all_requested.emit)
-        self.main_window.addAction(self.actionSelectAll)
-
-        # Deselect All shortcut
-        self.actionDeselectAll = QAction("Deselect All", self.main_window)
-        self.actionDeselectAll.setShortcut(QKeySequence("Ctrl+D"))
-        self.actionDeselectAll.triggered.connect(self.deselect_all_requested.emit)
-        self.main_window.addAction(self.actionDeselectAll)
-
-        # Focus shortcuts
-        self.actionFocusCanvas = QAction("Focus Canvas", self.main_window)
-        self.actionFocusCanvas.setShortcut(QKeySequence("F1"))
-        self.actionFocusCanvas.triggered.connect(self.focus_canvas_requested.emit)
-        self.main_window.addAction(self.actionFocusCanvas)
-
-        # Clear log shortcut
-        self.actionClearLog = QAction("Clear Log", self.main_window)
-        self.actionClearLog.setShortcut(QKeySequence("Ctrl+L"))
-        self.actionClearLog.triggered.connect(self.clear_log_requested.emit)
-        self.main_window.addAction(self.actionClearLog)
-
-        # Zoom shortcuts
-        self.actionZoomIn = QAction("Zoom In", self.main_window)
-        self.actionZoomIn.setShortcut(QKeySequence("Ctrl+="))
-        self.actionZoomIn.triggered.connect(self.zoom_in_requested.emit)
-        self.main_window.addAction(self.actionZoomIn)
-
-        self.actionZoomOut = QAction("Zoom Out", self.main_window)
-        self.actionZoomOut.setShortcut(QKeySequence("Ctrl+-"))
-        self.actionZoomOut.triggered.connect(self.zoom_out_requested.emit)
-        self.main_window.addAction(self.actionZoomOut)
-
-        self.actionZoomReset = QAction("Reset Zoom", self.main_window)
-        self.actionZoomReset.setShortcut(QKeySequence("Ctrl+0"))
-        self.actionZoomReset.triggered.connect(self.zoom_reset_requested.emit)
-        self.main_window.addAction(self.actionZoomReset)
-
-        # Center view shortcut
-        self.actionCenterView = QAction("Center View", self.main_window)
-        self.actionCenterView.setShortcut(QKeySequence("Home"))
-        self.actionCenterView.triggered.connect(self.center_view_requested.emit)
-        self.main_window.addAction(self.actionCenterView)
-
-        # Export PNG shortcut
-        self.actionExportPNG = QAction("Export as PNG", self.main_window)
-        self.actionExportPNG.setShortcut(QKeySequence("Ctrl+E"))
-        self.actionExportPNG.triggered.connect(self.export_png_requested.emit)
-        self.main_window.addAction(self.actionExportPNG)
-
-        # Register all additional actions with quick access toolbar (not pinned by default)
-        self.toolbar.register_action(self.actionCopy, "Copy")
-        self.toolbar.register_action(self.actionPaste, "Paste")
-        self.toolbar.register_action(self.actionCopyOutput, "Copy Output")
-        self.toolbar.register_action(self.actionSelectAll, "Select All")
-        self.toolbar.register_action(self.actionDeselectAll, "Deselect All")
-        self.toolbar.register_action(self.actionFocusCanvas, "Focus Canvas")
-        self.toolbar.register_action(self.actionClearLog, "Clear Log")
-        self.toolbar.register_action(self.actionZoomIn, "Zoom In")
-        self.toolbar.register_action(self.actionZoomOut, "Zoom Out")
-        self.toolbar.register_action(self.actionZoomReset, "Reset Zoom")
-        self.toolbar.register_action(self.actionCenterView, "Center View")
-        self.toolbar.register_action(self.actionExportPNG, "Export PNG")
+        add_to_window = self.main_window.addAction
+        register = self.toolbar.register_action
+        for attr, text, shortcut, signal, name in self.SHORTCUT_ACTIONS:
+            action = self._make_action(attr, text, shortcut, signal)
+            add_to_window(action)
+
+            # Register with quick access toolbar (not pinned by default)
+            register(action, name)
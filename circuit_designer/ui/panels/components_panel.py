@@ -4,6 +4,16 @@ from PyQt6.QtWidgets import (
 from circuit_designer.components import DraggableButton
 
 
+# (attribute, display name, component type, width, height in grid cells)
+COMPONENTS = (
+    ("btnResistor", "Resistor", "Resistor", 2, 1),
+    ("btnVdc", "Vdc", "Vdc", 1, 1),
+    ("btnGnd", "GND", "GND", 1, 1),
+    ("btnSwitch", "Switch", "Switch", 2, 1),
+    ("btnLED", "LED", "LED", 2, 1),  # has two terminals
+)
+
+
 class ComponentsPanel(QGroupBox):
     """Panel containing draggable component buttons"""
 
@@ -37,19 +47,10 @@ class ComponentsPanel(QGroupBox):
 
     def createComponentButtons(self):
         """Create all the draggable component buttons"""
-        # Draggable component buttons with sizes (width x height in grid cells)
-        self.btnResistor = DraggableButton("Resistor", "Resistor", 2, 1)  # 2x1 grid cells
-        self.btnVdc = DraggableButton("Vdc", "Vdc", 1, 1)  # 1x1 grid cell
-        self.btnGnd = DraggableButton("GND", "GND", 1, 1)  # 1x1 grid cell
-        self.btnSwitch = DraggableButton("Switch", "Switch", 2, 1)  # 2x1 grid cells
-        self.btnLED = DraggableButton("LED", "LED", 2, 1)  # 2x1 grid cells (has two terminals)
-
-        # Add buttons to layout
-        self.verticalLayout_buttons.addWidget(self.btnResistor)
-        self.verticalLayout_buttons.addWidget(self.btnVdc)
-        self.verticalLayout_buttons.addWidget(self.btnGnd)
-        self.verticalLayout_buttons.addWidget(self.btnSwitch)
-        self.verticalLayout_buttons.addWidget(self.btnLED)
+        for attr, display_name, component_type, size_w, size_h in COMPONENTS:
+            button = DraggableButton(display_name, component_type, size_w, size_h)
+            setattr(self, attr, button)
+            self.verticalLayout_buttons.addWidget(button)
 
     def addComponent(self, name, display_name, width, height):
         """Add a new component button to the panel"""
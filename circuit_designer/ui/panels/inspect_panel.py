@@ -1,41 +1,113 @@
+from contextlib import contextmanager
+
 from PyQt6.QtWidgets import (
     QGroupBox, QFormLayout, QLabel, QLineEdit, QComboBox,
     QPlainTextEdit, QPushButton, QSizePolicy, QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPointF
+from PyQt6.QtCore import Qt, pyqtSignal, QPointF, QTimer
+from PyQt6.QtGui import QPalette, QColor
+from PyQt6 import sip
 from circuit_designer.ui.widgets.value_input_widget import ValueInputWidget
 
 
+def _set_text_if_changed(widget, text):
+    """Set a label/line edit text only when it differs from the current one"""
+    if widget.text() != text:
+        widget.setText(text)
+
+
 class InspectPanel(QGroupBox):
     """Panel for inspecting and editing component properties"""
 
     # Signals
     field_changed = pyqtSignal()
 
+    # Rows per panel state (keys into the row pool), in display order. Rows
+    # shared between states keep the same relative order in every tuple.
+    DEFAULT_ROWS = ("default",)
+    COMPONENT_ROWS = ("name", "type", "position", "net_id")
+    WIRE_ROWS = ("type", "net_id", "wire_length", "bend_points", "wire_endpoints")
+    TYPE_ROWS = {
+        "Weerstand": COMPONENT_ROWS + ("resistance", "orientation"),
+        "Resistor": COMPONENT_ROWS + ("resistance", "orientation"),
+        "Spannings Bron": COMPONENT_ROWS + ("voltage",),
+        "Vdc": COMPONENT_ROWS + ("voltage",),
+        "Switch": COMPONENT_ROWS + ("switch_state", "orientation"),
+        "LED": COMPONENT_ROWS + ("led_state", "led_threshold", "orientation"),
+    }
+
+    # Method that shows a component's value, per component type
+    VALUE_UPDATERS = {
+        "Weerstand": "_show_resistance_value",
+        "Resistor": "_show_resistance_value",
+        "Spannings Bron": "_show_voltage_value",
+        "Vdc": "_show_voltage_value",
+        "Switch": "_show_switch_value",
+        "LED": "_show_led_value",
+    }
+
+    # comboOrient item index per orientation in degrees
+    ORIENTATION_INDEX = {0: 0, 90: 1, 180: 2, 270: 3}
+
+    # Size policy shared by every compacted row widget
+    COMPACT_SIZE_POLICY = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+
+    # Rows built on first use, mapped to the method that builds them
+    LAZY_ROWS = {
+        "resistance": "createResistanceField",
+        "voltage": "createVoltageField",
+        "switch_state": "createSwitchStateField",
+        "led_state": "createLEDFields",
+        "led_threshold": "createLEDFields",
+        "orientation": "createOrientationField",
+        "wire_length": "createWireFields",
+        "bend_points": "createWireFields",
+        "wire_endpoints": "createWireFields",
+    }
+
     def __init__(self):
-        super().__init__("Inspect")
+        super().__init__()
         self.selected_component = None
+        self._view = None
+        self._updating = False  # True while update_component_data fills the fields
+
+        # Typing restarts this timer, so a burst of keystrokes emits one field_changed
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(150)
+        self._debounce.timeout.connect(self.field_changed)
+        # The name is typed without a preview and committed when editing finishes
+        self._name_edited = False
+
         self.setupUi()
 
     def setupUi(self):
         """Setup the inspect panel UI"""
         self.setObjectName("InspectPanel")
+        # The group box was polished in its constructor, before it had an
+        # object name: repolish so the #InspectPanel rules of the application
+        # stylesheet apply, then set the title so its frame is laid out with them
+        self.style().unpolish(self)
+        self.style().polish(self)
+        self.setTitle("Inspect")
         self.formLayout_inspect = QFormLayout(self)
-        self.formLayout_inspect.setContentsMargins(6, 6, 6, 6)
-        self.formLayout_inspect.setHorizontalSpacing(4)
-        self.formLayout_inspect.setVerticalSpacing(2)
 
-        # Build UI
-        self.createDefaultElements()
-        self.createCommonFields()
-        self.createComponentSpecificFields()
-        self.createWireFields()
+        # Row pool: every row is built once (component-specific and wire rows
+        # on first use), but only the rows of the current state live in the
+        # form layout (see _apply_state)
+        self._rows = {}
+        self._visible_rows = ()
 
-        # Compact pass
+        # Compact pass (sets all layout spacings and margins)
         self.apply_compact_layout()
 
-        # Default state
-        self.show_default_state()
+        with self._batched_update():
+            # Build UI (rows every state needs; the rest is built by _apply_state)
+            self.createDefaultElements()
+            self.createCommonFields()
+
+            # Default state
+            self.show_default_state()
 
     def apply_compact_layout(self):
         """Make the inspect panel dense and top-aligned."""
@@ -50,244 +122,231 @@ class InspectPanel(QGroupBox):
         fl.setLabelAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
         fl.setFormAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
 
-        # Prevent vertical expansion of row widgets
-        fixed_h = 20
-        for w in self.findChildren((QLabel, QLineEdit, QComboBox, QPushButton, ValueInputWidget)):
-            w.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-            w.setMinimumHeight(fixed_h)
-            w.setMaximumHeight(fixed_h)
-
-        # Value labels fixed-height as well (prevents tall rows)
-        for name in ("labelTypeValue", "labelPositionValue", "labelNetIdValue",
-                     "labelWireLengthValue", "labelBendPointsValue",
-                     "labelWireEndpointsValue"):
-            if hasattr(self, name):
-                w = getattr(self, name)
-                w.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
-                w.setMinimumHeight(fixed_h)
-                w.setMaximumHeight(fixed_h)
-
-        # Global stylesheet trims
-        self.setStyleSheet(
-            """
-            #InspectPanel {
-                margin: 0px;
-            }
-            QGroupBox {
-                margin-top: 12px;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 6px;
-                padding: 0px 2px 2px 2px;
-                margin: 0px;
-            }
-            #InspectPanel QLabel {
-                margin: 0px;
-                padding: 0px;
-            }
-            #InspectPanel QLineEdit,
-            #InspectPanel QComboBox {
-                margin: 0px;
-                padding: 1px 3px;
-                font-size: 12px;
-            }
-            #InspectPanel QPlainTextEdit {
-                margin: 2px 0 0 0;
-                padding: 2px;
-                font-size: 12px;
-            }
-            #InspectPanel QPushButton {
-                margin: 2px 0 0 0;
-                padding: 2px 6px;
-                font-size: 12px;
-            }
-            """
-        )
+    @classmethod
+    def _make_compact(cls, widget):
+        """Prevent vertical expansion of a row widget (value labels included)."""
+        widget.setSizePolicy(cls.COMPACT_SIZE_POLICY)
+        widget.setFixedHeight(20)
 
     # ----- UI sections
 
     def createDefaultElements(self):
         self.labelDefaultInfo = QLabel("Select a component to view its properties")
-        self.labelDefaultInfo.setStyleSheet("color: gray; font-style: italic;")
+        palette = self.labelDefaultInfo.palette()
+        palette.setColor(QPalette.ColorRole.WindowText, QColor("gray"))
+        self.labelDefaultInfo.setPalette(palette)
+        font = self.labelDefaultInfo.font()
+        font.setItalic(True)
+        self.labelDefaultInfo.setFont(font)
         self.labelDefaultInfo.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.formLayout_inspect.addRow(self.labelDefaultInfo)
+        self._add_row("default", self.labelDefaultInfo, None)
 
     def createCommonFields(self):
         # Name
         self.labelName = QLabel("Name")
         self.editName = QLineEdit()
-        self.editName.textChanged.connect(self.field_changed.emit)
-        self.formLayout_inspect.addRow(self.labelName, self.editName)
+        # The name is not previewed anywhere, so only commit it when editing finishes
+        self.editName.textEdited.connect(self._on_name_edited)
+        self.editName.editingFinished.connect(self.flush_pending_edits)
+        self._add_row("name", self.labelName, self.editName)
 
         # Type
         self.labelType = QLabel("Type")
         self.labelTypeValue = QLabel("--")
-        self.labelTypeValue.setStyleSheet("font-weight: bold;")
-        self.formLayout_inspect.addRow(self.labelType, self.labelTypeValue)
+        font = self.labelTypeValue.font()
+        font.setBold(True)
+        self.labelTypeValue.setFont(font)
+        self._add_row("type", self.labelType, self.labelTypeValue)
 
         # Position
         self.labelPosition = QLabel("Position")
         self.labelPositionValue = QLabel("--")
-        self.formLayout_inspect.addRow(self.labelPosition, self.labelPositionValue)
+        self._position_text = "--"
+        self._add_row("position", self.labelPosition, self.labelPositionValue)
 
         # Net ID (read-only)
         self.labelNetId = QLabel("Net ID")
         self.labelNetIdValue = QLabel("--")
-        self.labelNetIdValue.setStyleSheet("font-family: monospace; color: #0066cc;")
+        self.labelNetIdValue.setProperty("role", "netid")  # Styled in APP_STYLESHEET
         self.labelNetIdValue.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-        self.formLayout_inspect.addRow(self.labelNetId, self.labelNetIdValue)
+        self._add_row("net_id", self.labelNetId, self.labelNetIdValue)
 
-    def createComponentSpecificFields(self):
-        # Resistance
+    def createResistanceField(self):
         self.labelResistance = QLabel("Resistance")
         self.editResistance = ValueInputWidget(unit="Ω")
         self.editResistance.setPlaceholderText("e.g., 1Ω, 470Ω, 1000Ω")
-        self.editResistance.textChanged.connect(self.field_changed.emit)
-        self.formLayout_inspect.addRow(self.labelResistance, self.editResistance)
+        self.editResistance.textChanged.connect(self._on_value_edited)
+        self.editResistance.editingFinished.connect(self.flush_pending_edits)
+        self._add_row("resistance", self.labelResistance, self.editResistance)
 
-        # Voltage
+    def createVoltageField(self):
         self.labelVoltage = QLabel("Voltage")
         self.editVoltage = ValueInputWidget(unit="V")
         self.editVoltage.setPlaceholderText("e.g., 5V, 12V")
-        self.editVoltage.textChanged.connect(self.field_changed.emit)
-        self.formLayout_inspect.addRow(self.labelVoltage, self.editVoltage)
+        self.editVoltage.textChanged.connect(self._on_value_edited)
+        self.editVoltage.editingFinished.connect(self.flush_pending_edits)
+        self._add_row("voltage", self.labelVoltage, self.editVoltage)
 
-        # Switch State
+    def createSwitchStateField(self):
         self.labelSwitchState = QLabel("State")
         self.comboSwitchState = QComboBox()
         self.comboSwitchState.addItems(["Open", "Closed"])
-        self.comboSwitchState.currentTextChanged.connect(self.field_changed.emit)
-        self.formLayout_inspect.addRow(self.labelSwitchState, self.comboSwitchState)
+        self.comboSwitchState.currentTextChanged.connect(self._on_field_changed)
+        self._add_row("switch_state", self.labelSwitchState, self.comboSwitchState)
 
+    def createLEDFields(self):
         # LED State
         self.labelLEDState = QLabel("State")
         self.labelLEDStateValue = QLabel("--")
-        self.formLayout_inspect.addRow(self.labelLEDState, self.labelLEDStateValue)
+        self._add_row("led_state", self.labelLEDState, self.labelLEDStateValue)
 
         # LED Threshold Voltage
         self.labelLEDThreshold = QLabel("Threshold")
         self.editLEDThreshold = ValueInputWidget()
         self.editLEDThreshold.setPlaceholderText("e.g., 1.5V, 2V")
-        self.editLEDThreshold.textChanged.connect(self.field_changed.emit)
-        self.formLayout_inspect.addRow(self.labelLEDThreshold, self.editLEDThreshold)
+        self.editLEDThreshold.textChanged.connect(self._on_value_edited)
+        self.editLEDThreshold.editingFinished.connect(self.flush_pending_edits)
+        self._add_row("led_threshold", self.labelLEDThreshold, self.editLEDThreshold)
 
-        # Orientation
+    def createOrientationField(self):
         self.labelOrient = QLabel("Orientation")
         self.comboOrient = QComboBox()
         self.comboOrient.addItems(["0°", "90°", "180°", "270°"])
-        self.comboOrient.currentTextChanged.connect(self.field_changed.emit)
-        self.formLayout_inspect.addRow(self.labelOrient, self.comboOrient)
+        self.comboOrient.currentTextChanged.connect(self._on_field_changed)
+        self._add_row("orientation", self.labelOrient, self.comboOrient)
 
     def createWireFields(self):
         self.labelWireLength = QLabel("Wire Length")
         self.labelWireLengthValue = QLabel("--")
-        self.formLayout_inspect.addRow(self.labelWireLength, self.labelWireLengthValue)
+        self._add_row("wire_length", self.labelWireLength, self.labelWireLengthValue)
 
         self.labelBendPoints = QLabel("Bend Points")
         self.labelBendPointsValue = QLabel("--")
-        self.formLayout_inspect.addRow(self.labelBendPoints, self.labelBendPointsValue)
+        self._add_row("bend_points", self.labelBendPoints, self.labelBendPointsValue)
 
         self.labelWireEndpoints = QLabel("Endpoints")
         self.labelWireEndpointsValue = QLabel("--")
-        self.formLayout_inspect.addRow(self.labelWireEndpoints, self.labelWireEndpointsValue)
+        self._add_row("wire_endpoints", self.labelWireEndpoints, self.labelWireEndpointsValue)
+
+    # ----- Row pool
+
+    def _add_row(self, key, label, field):
+        """Register a row with the pool; _apply_state puts it in the layout."""
+        self._rows[key] = (label, field)
+        self._make_compact(label)
+        if field is not None:
+            self._make_compact(field)
+
+    def _insert_row(self, index, key):
+        label, field = self._rows[key]
+        if field is None:
+            self.formLayout_inspect.insertRow(index, label)
+        else:
+            self.formLayout_inspect.insertRow(index, label, field)
+            field.show()
+        label.show()
+
+    def _take_row(self, index, key):
+        # takeRow() detaches the row without deleting its widgets, so they
+        # stay available for the next state that needs them. The layout items
+        # wrapping them become ours, and PyQt doesn't own them: delete them
+        # (which leaves the widgets alone) or every row swap leaks two items.
+        taken = self.formLayout_inspect.takeRow(index)
+        for item in (taken.labelItem, taken.fieldItem):
+            if item is not None:
+                sip.delete(item)
+        label, field = self._rows[key]
+        label.hide()
+        if field is not None:
+            field.hide()
+
+    def _apply_state(self, row_keys):
+        """Keep only the rows in row_keys (a state tuple) in the form layout."""
+        current = self._visible_rows
+        if row_keys == current:
+            return
+
+        for key in row_keys:
+            if key not in self._rows:
+                getattr(self, self.LAZY_ROWS[key])()
+
+        with self._batched_update():
+            # Remove leaving rows back to front so indices stay valid
+            for index in range(len(current) - 1, -1, -1):
+                if current[index] not in row_keys:
+                    self._take_row(index, current[index])
+            remaining = set(current)
+            for index, key in enumerate(row_keys):
+                if key not in remaining:
+                    self._insert_row(index, key)
+        self._visible_rows = row_keys
+
+    def shows_row(self, key):
+        """Whether the row `key` (e.g. "name", "orientation") is currently shown"""
+        return key in self._visible_rows
+
+    def flush_pending_edits(self):
+        """Emit field_changed right away for edits not yet committed.
+
+        Covers the debounced value fields and a name still being typed; called on
+        Enter / focus-out, before the selection changes and before save / run.
+        """
+        if self._debounce.isActive() or self._name_edited:
+            self._debounce.stop()
+            self._name_edited = False
+            self.field_changed.emit()
+
+    @contextmanager
+    def _batched_update(self):
+        """Coalesce repaints and relayouts of the enclosed changes into one pass."""
+        if not self.updatesEnabled():
+            # Already inside a batch; the outermost one flushes
+            yield
+            return
+
+        self.setUpdatesEnabled(False)
+        self.formLayout_inspect.setEnabled(False)
+        try:
+            yield
+        finally:
+            self.formLayout_inspect.setEnabled(True)
+            self.formLayout_inspect.invalidate()
+            self.setUpdatesEnabled(True)
+
+    @contextmanager
+    def _updating_fields(self):
+        """Suppress field_changed while the panel itself fills in the fields."""
+        self._updating = True
+        try:
+            yield
+        finally:
+            self._updating = False
+
+    def _on_field_changed(self):
+        if not self._updating:
+            self.field_changed.emit()
+
+    def _on_name_edited(self):
+        self._name_edited = True
+
+    def _on_value_edited(self):
+        # Typing restarts the debounce timer (see __init__)
+        if not self._updating:
+            self._debounce.start()
 
     # ----- Visibility
 
     def show_default_state(self):
-        try:
-            self.labelDefaultInfo.show()
-            widgets_to_hide = [
-                'labelName', 'editName', 'labelType', 'labelTypeValue',
-                'labelPosition', 'labelPositionValue', 'labelResistance', 'editResistance',
-                'labelVoltage', 'editVoltage', 'labelSwitchState', 'comboSwitchState',
-                'labelLEDState', 'labelLEDStateValue', 'labelLEDThreshold', 'editLEDThreshold',
-                'labelOrient', 'comboOrient', 'labelWireLength', 'labelWireLengthValue',
-                'labelBendPoints', 'labelBendPointsValue', 'labelNetId', 'labelNetIdValue',
-                'labelWireEndpoints', 'labelWireEndpointsValue'
-            ]
-            for widget_name in widgets_to_hide:
-                if hasattr(self, widget_name):
-                    getattr(self, widget_name).hide()
-        except Exception as e:
-            print(f"Error in show_default_state: {e}")
+        # Apply a pending edit before the selection it belongs to goes away
+        self.flush_pending_edits()
+        self.selected_component = None
+        self._apply_state(self.DEFAULT_ROWS)
 
     def show_component_fields(self, component_type):
-        try:
-            self.labelDefaultInfo.hide()
-
-            # Common
-            self.labelName.show(); self.editName.show()
-            self.labelType.show(); self.labelTypeValue.show()
-            self.labelPosition.show(); self.labelPositionValue.show()
-
-            # Hide specifics
-            fields_to_hide = [
-                ('labelResistance', 'editResistance'),
-                ('labelVoltage', 'editVoltage'),
-                ('labelSwitchState', 'comboSwitchState'),
-                ('labelLEDState', 'labelLEDStateValue'),
-                ('labelLEDThreshold', 'editLEDThreshold'),
-                ('labelOrient', 'comboOrient'),
-                ('labelWireLength', 'labelWireLengthValue'),
-                ('labelBendPoints', 'labelBendPointsValue'),
-                ('labelWireEndpoints', 'labelWireEndpointsValue')
-            ]
-            for label_name, widget_name in fields_to_hide:
-                if hasattr(self, label_name): getattr(self, label_name).hide()
-                if hasattr(self, widget_name): getattr(self, widget_name).hide()
-
-            # Show by type
-            if component_type in ["Weerstand", "Resistor"]:
-                self.labelResistance.show(); self.editResistance.show()
-                self.labelOrient.show(); self.comboOrient.show()
-            elif component_type in ["Spannings Bron", "Vdc"]:
-                self.labelVoltage.show(); self.editVoltage.show()
-            elif component_type == "Switch":
-                self.labelSwitchState.show(); self.comboSwitchState.show()
-                self.labelOrient.show(); self.comboOrient.show()
-            elif component_type == "LED":
-                self.labelLEDState.show(); self.labelLEDStateValue.show()
-                self.labelLEDThreshold.show(); self.editLEDThreshold.show()
-                self.labelOrient.show(); self.comboOrient.show()
-
-            # Net ID always
-            self.labelNetId.show(); self.labelNetIdValue.show()
-
-        except Exception as e:
-            print(f"Error in show_component_fields: {e}")
+        self._apply_state(self.TYPE_ROWS.get(component_type, self.COMPONENT_ROWS))
 
     def show_wire_fields(self):
-        try:
-            self.labelDefaultInfo.hide()
-
-            # Hide component fields
-            component_fields = [
-                'labelName', 'editName', 'labelPosition', 'labelPositionValue',
-                'labelResistance', 'editResistance', 'labelVoltage', 'editVoltage',
-                'labelSwitchState', 'comboSwitchState', 'labelLEDState', 'labelLEDStateValue',
-                'labelLEDThreshold', 'editLEDThreshold',
-                'labelOrient', 'comboOrient'
-            ]
-            for field_name in component_fields:
-                if hasattr(self, field_name):
-                    getattr(self, field_name).hide()
-
-            # Show wire fields
-            wire_fields = [
-                ('labelType', 'labelTypeValue'),
-                ('labelWireLength', 'labelWireLengthValue'),
-                ('labelBendPoints', 'labelBendPointsValue'),
-                ('labelWireEndpoints', 'labelWireEndpointsValue'),
-                ('labelNetId', 'labelNetIdValue')
-            ]
-            for label_name, widget_name in wire_fields:
-                if hasattr(self, label_name): getattr(self, label_name).show()
-                if hasattr(self, widget_name): getattr(self, widget_name).show()
-
-        except Exception as e:
-            print(f"Error in show_wire_fields: {e}")
+        self._apply_state(self.WIRE_ROWS)
 
     # ----- Data updates
 
@@ -295,112 +354,123 @@ class InspectPanel(QGroupBox):
         """Update the panel with component data"""
         self.selected_component = component
 
-        if hasattr(component, 'component_type'):
+        if not hasattr(component, 'component_type'):
+            return
+
+        with self._batched_update():
             self.show_component_fields(component.component_type)
-            self.labelTypeValue.setText(component.component_type)
+            _set_text_if_changed(self.labelTypeValue, component.component_type)
 
-            # Position (grid indices if available)
-            if hasattr(component, 'get_display_grid_position'):
-                gx, gy = component.get_display_grid_position()
-                self.labelPositionValue.setText(f"({gx}, {gy})")
-            else:
-                pos = component.pos()
-                self.labelPositionValue.setText(f"({pos.x():.0f}, {pos.y():.0f})")
+            self.update_component_position(component)
 
             # Net ID - generate backend identifier
             # This matches the format used in backend_integration.py
             component_type = component.component_type
             net_id = f"{component_type}_{id(component) % 10000}"  # Simple unique ID
-            self.labelNetIdValue.setText(net_id)
-
-            # Common values
-            if hasattr(component, 'name'):
-                old_block = self.editName.blockSignals(True)
-                self.editName.setText(component.name or "")
-                self.editName.blockSignals(old_block)
-
-            # Orientation if visible
-            if hasattr(component, 'orientation') and self.comboOrient.isVisible():
-                orientation_text = f"{component.orientation}°"
-                index = self.comboOrient.findText(orientation_text)
-                if index >= 0:
-                    old_block = self.comboOrient.blockSignals(True)
-                    self.comboOrient.setCurrentIndex(index)
-                    self.comboOrient.blockSignals(old_block)
-
-            if hasattr(component, 'value'):
-                value = component.value or ""
-                if component.component_type == "Resistor":
-                    old_block = self.editResistance.blockSignals(True)
-                    self.editResistance.setText(value)
-                    self.editResistance.blockSignals(old_block)
-                elif component.component_type == "Vdc":
-                    old_block = self.editVoltage.blockSignals(True)
-                    self.editVoltage.setText(value)
-                    self.editVoltage.blockSignals(old_block)
-                elif component.component_type == "Switch":
-                    old_block = self.comboSwitchState.blockSignals(True)
-                    index = self.comboSwitchState.findText(value)
-                    if index >= 0:
-                        self.comboSwitchState.setCurrentIndex(index)
-                    self.comboSwitchState.blockSignals(old_block)
-                elif component.component_type == "LED":
-                    self.labelLEDStateValue.setText(value)
-                    # Also set threshold if component has it
-                    if hasattr(component, 'led_threshold'):
-                        old_block = self.editLEDThreshold.blockSignals(True)
-                        self.editLEDThreshold.setText(str(component.led_threshold) + "V")
-                        self.editLEDThreshold.blockSignals(old_block)
+            _set_text_if_changed(self.labelNetIdValue, net_id)
+
+            # Programmatic edits must not echo back as field_changed
+            with self._updating_fields():
+                # Common values
+                if hasattr(component, 'name'):
+                    _set_text_if_changed(self.editName, component.name or "")
+
+                # Orientation if visible
+                if hasattr(component, 'orientation') and self.shows_row("orientation"):
+                    index = self.ORIENTATION_INDEX.get(component.orientation, -1)
+                    if index >= 0 and self.comboOrient.currentIndex() != index:
+                        self.comboOrient.setCurrentIndex(index)
+
+                updater = self.VALUE_UPDATERS.get(component_type)
+                if updater and hasattr(component, 'value'):
+                    getattr(self, updater)(component, component.value or "")
+
+    def _show_resistance_value(self, component, value):
+        _set_text_if_changed(self.editResistance, value)
+
+    def _show_voltage_value(self, component, value):
+        _set_text_if_changed(self.editVoltage, value)
+
+    def _show_switch_value(self, component, value):
+        index = self.comboSwitchState.findText(value)
+        if index >= 0:
+            self.comboSwitchState.setCurrentIndex(index)
+
+    def _show_led_value(self, component, value):
+        _set_text_if_changed(self.labelLEDStateValue, value)
+        # Also set threshold if component has it
+        if hasattr(component, 'led_threshold'):
+            _set_text_if_changed(self.editLEDThreshold, str(component.led_threshold) + "V")
+
+    def update_component_position(self, component):
+        """Refresh only the position row; used for live updates while dragging"""
+        # Position (grid indices if available); compared against the last
+        # text set, as drags refresh this far more often than it changes
+        if hasattr(component, 'get_display_grid_position'):
+            gx, gy = component.get_display_grid_position()
+            position_text = f"({gx}, {gy})"
+        else:
+            pos = component.pos()
+            position_text = f"({pos.x():.0f}, {pos.y():.0f})"
+        if position_text != self._position_text:
+            self._position_text = position_text
+            self.labelPositionValue.setText(position_text)
+
+    @staticmethod
+    def _fmt_point(pt, g):
+        """Format a wire endpoint as grid (or scene) coordinates plus its point id"""
+        if not pt:
+            return "--"
+        if hasattr(pt, 'get_scene_pos'):
+            pos = pt.get_scene_pos()
+        else:
+            pos = pt.scenePos() if hasattr(pt, 'scenePos') else QPointF(0, 0)
+        if g:
+            gx = int(round(pos.x() / g))
+            gy = int(round(pos.y() / g))
+            coord = f"({gx},{gy})"
+        else:
+            coord = f"({pos.x():.0f},{pos.y():.0f})"
+        pid = getattr(pt, 'point_id', '')
+        if pid:
+            coord += f":{pid}"
+        return coord
+
+    def set_view(self, view):
+        """Set the graphics view whose grid spacing wire endpoints are shown in"""
+        self._view = view
 
     def update_wire_data(self, wire):
         """Update the panel with wire data, including endpoint grid coordinates"""
-        self.show_wire_fields()
-        self.labelTypeValue.setText("Wire")
-
-        # Net ID - generate backend identifier for wire
-        wire_id = f"wire_{id(wire) % 10000}"  # Simple unique ID
-        self.labelNetIdValue.setText(wire_id)
-
-        # Length
-        if hasattr(wire, 'line'):
-            line = wire.line()
-            length = ((line.x2() - line.x1())**2 + (line.y2() - line.y1())**2)**0.5
-            self.labelWireLengthValue.setText(f"{length:.1f}px")
-
-        # Bend count
-        bend_count = len(getattr(wire, 'bend_points', [])) if hasattr(wire, 'bend_points') else 0
-        self.labelBendPointsValue.setText(str(bend_count))
-
-        # Endpoints (grid coords if view provides spacing)
-        try:
-            if wire.scene() and wire.scene().views():
-                view = wire.scene().views()[0]
-                g = getattr(view, 'grid_spacing', None)
-            else:
-                g = None
+        self.flush_pending_edits()
+        self.selected_component = None
+        with self._batched_update():
+            self.show_wire_fields()
+            _set_text_if_changed(self.labelTypeValue, "Wire")
+
+            # Net ID - generate backend identifier for wire
+            wire_id = f"wire_{id(wire) % 10000}"  # Simple unique ID
+            _set_text_if_changed(self.labelNetIdValue, wire_id)
+
+            # Length
+            if hasattr(wire, 'line'):
+                length = wire.line().length()
+                _set_text_if_changed(self.labelWireLengthValue, f"{length:.1f}px")
+
+            # Bend count
+            bend_count = len(getattr(wire, 'bend_points', ()))
+            _set_text_if_changed(self.labelBendPointsValue, str(bend_count))
+
+            # Endpoints (grid coords if view provides spacing)
+            # The view owns the spacing (set by CanvasManager.draw_grid)
+            g = getattr(self._view, 'grid_spacing', None)
             start_pt = getattr(wire, 'start_point', None)
             end_pt = getattr(wire, 'end_point', None)
-
-            def fmt_point(pt):
-                if not pt:
-                    return "--"
-                if hasattr(pt, 'get_scene_pos'):
-                    pos = pt.get_scene_pos()
-                else:
-                    pos = pt.scenePos() if hasattr(pt, 'scenePos') else QPointF(0, 0)
-                if g:
-                    gx = int(round(pos.x() / g))
-                    gy = int(round(pos.y() / g))
-                    coord = f"({gx},{gy})"
-                else:
-                    coord = f"({pos.x():.0f},{pos.y():.0f})"
-                pid = getattr(pt, 'point_id', '')
-                if pid:
-                    coord += f":{pid}"
-                return coord
-
-            start_txt = fmt_point(start_pt)
-            end_txt = fmt_point(end_pt)
-            self.labelWireEndpointsValue.setText(f"{start_txt} -> {end_txt}")
-        except Exception:
-            self.labelWireEndpointsValue.setText("--")
+            try:
+                start_txt = self._fmt_point(start_pt, g)
+                end_txt = self._fmt_point(end_pt, g)
+            except (AttributeError, RuntimeError):
+                # Endpoint without a usable position, or one whose item was deleted
+                _set_text_if_changed(self.labelWireEndpointsValue, "--")
+            else:
+                _set_text_if_changed(self.labelWireEndpointsValue, f"{start_txt} -> {end_txt}")
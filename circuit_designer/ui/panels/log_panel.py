@@ -1,12 +1,16 @@
 from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QPlainTextEdit
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QTimer
 
 
 class LogPanel(QGroupBox):
     """Panel for displaying application logs"""
 
+    # Oldest lines are dropped beyond this, keeping appends cheap in long sessions
+    MAX_LOG_LINES = 2000
+
     def __init__(self):
         super().__init__("Log")
+        self._pending = []  # Messages waiting for the next flush
         self.setupUi()
 
     def setupUi(self):
@@ -15,19 +19,36 @@ class LogPanel(QGroupBox):
 
         self.textLog = QPlainTextEdit()
         self.textLog.setReadOnly(True)
+        self.textLog.setMaximumBlockCount(self.MAX_LOG_LINES)
+        # Read-only log: appends need no undo history
+        self.textLog.document().setUndoRedoEnabled(False)
         self.textLog.setPlainText(
             "[Welcome] Application started successfully."
         )
         self.verticalLayout_log.addWidget(self.textLog)
 
     def log_message(self, message):
-        """Add a message to the log"""
-        self.textLog.appendPlainText(message)
+        """Add a message to the log
+
+        Messages logged in one burst (e.g. a simulation run) are appended
+        together on the next event loop pass, so the log repaints once.
+        """
+        if not self._pending:
+            QTimer.singleShot(0, self._flush)
+        self._pending.append(message)
+
+    def _flush(self):
+        """Append all pending messages in one go"""
+        if self._pending:
+            self.textLog.appendPlainText("\n".join(self._pending))
+            self._pending.clear()
 
     def clear_log(self):
         """Clear all log messages"""
+        self._pending.clear()
         self.textLog.clear()
 
     def get_log_text(self):
         """Get all log text"""
+        self._flush()
         return self.textLog.toPlainText()
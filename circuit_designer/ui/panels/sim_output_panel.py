@@ -1,4 +1,4 @@
-from PyQt6.QtWidgets import QGroupBox, QVBoxLayout, QLabel, QTextBrowser, QPushButton, QSizePolicy, QFrame
+from PyQt6.QtWidgets import QApplication, QGroupBox, QVBoxLayout, QLabel, QTextBrowser, QPushButton, QSizePolicy, QFrame
 from PyQt6.QtCore import Qt, pyqtSignal, QUrl
 
 
@@ -11,6 +11,7 @@ class SimulationOutputPanel(QGroupBox):
 
     def __init__(self):
         super().__init__("Simulation Output")
+        self._output = ("", False)  # Last (text, is_html) given to set_output
         self._setup_ui()
 
     def _setup_ui(self):
@@ -39,14 +40,7 @@ class SimulationOutputPanel(QGroupBox):
         layout.addWidget(self.textOutput, 1)
         layout.addWidget(self.btnCopyOutput, 0, alignment=Qt.AlignmentFlag.AlignLeft)
 
-        # Light style for compactness
-        self.setStyleSheet(
-            """
-            #SimulationOutputPanel QLabel { margin: 0; padding: 0; }
-            #SimulationOutputPanel QTextBrowser { margin: 2px 0 0 0; padding: 2px; font-size: 12px; }
-            #SimulationOutputPanel QPushButton { margin: 2px 0 0 0; padding: 2px 6px; font-size: 12px; }
-            """
-        )
+        # Compact styling comes from APP_STYLESHEET (#SimulationOutputPanel rules)
 
     def _on_anchor_clicked(self, url: QUrl):
         """Handle clicks on node name and LED links"""
@@ -62,15 +56,37 @@ class SimulationOutputPanel(QGroupBox):
 
     # Helpers
     def clear_output(self):
+        self._output = ("", False)
         self.textOutput.clear()
 
     def set_output(self, text: str, is_html: bool = False):
-        """Set output text. If is_html is True, text is treated as HTML."""
-        if is_html:
-            self.textOutput.setHtml(text or "")
-        else:
-            self.textOutput.setPlainText(text or "")
+        """Set output text. If is_html is True, text is treated as HTML.
+
+        Re-running an unchanged circuit yields the same output; the document
+        is only rebuilt when the text differs from what is shown.
+        """
+        text = text or ""
+        if (text, is_html) == self._output:
+            return
+        self._output = (text, is_html)
+        # A long simulation log is laid out once, then painted once
+        self.textOutput.setUpdatesEnabled(False)
+        try:
+            if is_html:
+                self.textOutput.setHtml(text)
+            else:
+                self.textOutput.setPlainText(text)
+        finally:
+            self.textOutput.setUpdatesEnabled(True)
 
     def get_output_text(self) -> str:
         return self.textOutput.toPlainText()
 
+    def copy_output(self) -> bool:
+        """Copy the output text to the clipboard; returns False if there is none"""
+        output_text = self.textOutput.toPlainText()
+        if not output_text.strip():
+            return False
+        QApplication.clipboard().setText(output_text)
+        return True
+
@@ -5,8 +5,87 @@ Custom value input widget with increment/decrement arrows and auto-formatting
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QToolButton, QApplication
 from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QFont
+from functools import lru_cache
 import re
 
+# A bare number with an optional metric prefix, which auto_format completes with the unit
+_AUTO_FMT_RE = re.compile(r'^[\d.]+[kmMuUnNpPgG]?$', re.IGNORECASE)
+
+# Number followed by an optional prefix, matched against the uppercased text
+_PARSE_RE = re.compile(r'([\d.]+)\s*([A-Z]*)')
+
+# Metric prefixes
+_MULTIPLIERS = {
+    'P': 1e-12,  # pico
+    'N': 1e-9,   # nano
+    'U': 1e-6,   # micro
+    'M': 1e-3,   # milli (for current)
+    'K': 1e3,    # kilo
+    'MEG': 1e6,  # mega
+    'G': 1e9,    # giga
+}
+
+# Special case for M (could be milli or mega)
+# For resistors, M usually means mega
+# For current (and anything else), m usually means milli
+_UNIT_MULTIPLIERS = {
+    'Ω': {**_MULTIPLIERS, 'M': 1e6},
+}
+
+# format_value's prefixes, largest first: (threshold, multiplier, divisor,
+# prefix). Large values are divided and small ones multiplied so the
+# rounding matches the literal arithmetic; anything below the last
+# threshold is shown in pico.
+_FORMAT_PREFIXES = (
+    (1e9, 1, 1e9, 'G'),
+    (1e6, 1, 1e6, 'M'),
+    (1e3, 1, 1e3, 'k'),
+    (1, 1, 1, ''),
+    (1e-3, 1e3, 1, 'm'),
+    (1e-6, 1e6, 1, 'u'),
+    (1e-9, 1e9, 1, 'n'),
+)
+
+# Style for the arrow buttons
+_ARROW_BUTTON_STYLE = """
+    QToolButton {
+        border: none;
+        background: transparent;
+        color: #b0b0b0;
+        font-size: 9px;
+        padding: 0px;
+        margin: 0px;
+    }
+    QToolButton:hover {
+        color: #808080;
+    }
+    QToolButton:pressed {
+        color: #606060;
+    }
+"""
+
+
+def _clean_format(val, decimals=6):
+    """Format a number with trailing zeros removed"""
+    formatted = f"{val:.{decimals}f}"
+    # Remove trailing zeros and decimal point if not needed
+    return formatted.rstrip('0').rstrip('.')
+
+
+@lru_cache(maxsize=2048)
+def _format_value(value, unit):
+    """Format a base value with the appropriate prefix and unit"""
+    if value == 0:
+        return f"0{unit}"
+
+    abs_value = abs(value)
+
+    # Choose appropriate prefix
+    for threshold, multiplier, divisor, prefix in _FORMAT_PREFIXES:
+        if abs_value >= threshold:
+            return f"{_clean_format(value * multiplier / divisor)}{prefix}{unit}"
+    return f"{_clean_format(value * 1e12)}p{unit}"
+
 
 class ValueInputWidget(QLineEdit):
     """Input widget with up/down arrows for incrementing values"""
@@ -16,9 +95,24 @@ class ValueInputWidget(QLineEdit):
     def __init__(self, unit="Ω", parent=None):
         super().__init__(parent)
         self.unit = unit
-        self.lineEdit = self  # For compatibility with existing code
+
+        # The unit is fixed, so everything parse_value derives from it is too
+        self._unit_upper = unit.upper()
+        self._unit_lower = unit.lower()
+        self._multipliers = _UNIT_MULTIPLIERS.get(unit, _MULTIPLIERS)
+
+        # Last text parse_value saw and its result; arrow auto-repeat parses
+        # the text the previous step just set
+        self._parsed_text = None
+        self._parsed_value = None
+
         self.setupUi()
 
+    @property
+    def lineEdit(self):
+        """The widget itself; for compatibility with existing code"""
+        return self
+
     def setupUi(self):
         # Set placeholder
         self.setPlaceholderText(f"e.g., 1k{self.unit}, 470{self.unit}")
@@ -53,32 +147,15 @@ class ValueInputWidget(QLineEdit):
         self.btnDown.clicked.connect(self.decrement)
         arrow_layout.addWidget(self.btnDown)
 
+        # Style both buttons through their container (one style sheet parse)
+        arrow_container.setStyleSheet(_ARROW_BUTTON_STYLE)
+
         # Store arrow container for positioning
         self.arrow_container = arrow_container
 
         # Connect signals
         self.editingFinished.connect(self.auto_format)
 
-        # Style for buttons
-        button_style = """
-            QToolButton {
-                border: none;
-                background: transparent;
-                color: #b0b0b0;
-                font-size: 9px;
-                padding: 0px;
-                margin: 0px;
-            }
-            QToolButton:hover {
-                color: #808080;
-            }
-            QToolButton:pressed {
-                color: #606060;
-            }
-        """
-        self.btnUp.setStyleSheet(button_style)
-        self.btnDown.setStyleSheet(button_style)
-
     def resizeEvent(self, event):
         """Position the arrow container on the right side when resized"""
         super().resizeEvent(event)
@@ -117,43 +194,33 @@ class ValueInputWidget(QLineEdit):
             return
 
         # If it's just a number or has a prefix (k, M, m, etc.), add unit
-        if re.match(r'^[\d.]+[kmMuUnNpPgG]?$', text, re.IGNORECASE):
+        if _AUTO_FMT_RE.match(text):
             self.setText(text + self.unit)
             self._last_valid_value = self.text()
 
     def parse_value(self):
         """Parse the current value to a base number. Returns None if invalid."""
-        text = self.text().strip().upper()
+        raw = self.text()
+        if raw != self._parsed_text:
+            self._parsed_value = self._parse_text(raw)
+            self._parsed_text = raw
+        return self._parsed_value
+
+    def _parse_text(self, text):
+        """Parse text to a base number. Returns None if invalid."""
+        text = text.strip().upper()
         if not text:
             return 0.0
 
         # Remove the unit
-        text = text.replace(self.unit.upper(), '').replace(self.unit.lower(), '')
+        text = text.replace(self._unit_upper, '').replace(self._unit_lower, '')
         text = text.strip()
 
         # Handle metric prefixes
-        multipliers = {
-            'P': 1e-12,  # pico
-            'N': 1e-9,   # nano
-            'U': 1e-6,   # micro
-            'M': 1e-3,   # milli (for current)
-            'K': 1e3,    # kilo
-            'MEG': 1e6,  # mega
-            'G': 1e9,    # giga
-        }
-
-        # Special case for M (could be milli or mega)
-        # For resistors, M usually means mega
-        # For current, m usually means milli
-        if self.unit == 'A' and 'M' in text and not 'MEG' in text:
-            # Current: M means milli
-            multipliers['M'] = 1e-3
-        elif self.unit == 'Ω':
-            # Resistance: M means mega
-            multipliers['M'] = 1e6
+        multipliers = self._multipliers
 
         # Extract number and prefix
-        match = re.match(r'([\d.]+)\s*([A-Z]*)', text)
+        match = _PARSE_RE.match(text)
         if not match:
             try:
                 value = float(text)
@@ -183,35 +250,7 @@ class ValueInputWidget(QLineEdit):
 
     def format_value(self, value):
         """Format a base value with appropriate prefix"""
-        if value == 0:
-            return f"0{self.unit}"
-
-        abs_value = abs(value)
-
-        # Helper function to format with trailing zeros removed
-        def clean_format(val, decimals=6):
-            formatted = f"{val:.{decimals}f}"
-            # Remove trailing zeros and decimal point if not needed
-            formatted = formatted.rstrip('0').rstrip('.')
-            return formatted
-
-        # Choose appropriate prefix
-        if abs_value >= 1e9:
-            return f"{clean_format(value/1e9)}G{self.unit}"
-        elif abs_value >= 1e6:
-            return f"{clean_format(value/1e6)}M{self.unit}"
-        elif abs_value >= 1e3:
-            return f"{clean_format(value/1e3)}k{self.unit}"
-        elif abs_value >= 1:
-            return f"{clean_format(value)}{self.unit}"
-        elif abs_value >= 1e-3:
-            return f"{clean_format(value*1e3)}m{self.unit}"
-        elif abs_value >= 1e-6:
-            return f"{clean_format(value*1e6)}u{self.unit}"
-        elif abs_value >= 1e-9:
-            return f"{clean_format(value*1e9)}n{self.unit}"
-        else:
-            return f"{clean_format(value*1e12)}p{self.unit}"
+        return _format_value(value, self.unit)
 
     def increment(self):
         """Increment the value"""
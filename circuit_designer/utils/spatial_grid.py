@@ -7,6 +7,22 @@ from typing import Set, Tuple, Optional
 from circuit_designer.components import ComponentItem
 
 
+def _ring_offsets(radius: int):
+    """
+    Yield the (dx, dy) offsets on the square ring at the given radius.
+
+    Same order as scanning the full square column by column and skipping
+    the interior, but without visiting the interior cells.
+    """
+    for dy in range(-radius, radius + 1):
+        yield -radius, dy
+    for dx in range(-radius + 1, radius):
+        yield dx, -radius
+        yield dx, radius
+    for dy in range(-radius, radius + 1):
+        yield radius, dy
+
+
 class SpatialGrid:
     """
     Spatial hash map for tracking occupied grid cells.
@@ -15,10 +31,13 @@ class SpatialGrid:
 
     def __init__(self):
         self.occupied_cells: dict[Tuple[int, int], ComponentItem] = {}
+        # Cells each component was last recorded at, so moves can apply a delta
+        self._component_cells: dict[ComponentItem, Set[Tuple[int, int]]] = {}
 
     def clear(self):
         """Clear all tracked cells."""
         self.occupied_cells.clear()
+        self._component_cells.clear()
 
     def add_component(self, component: ComponentItem):
         """
@@ -30,9 +49,10 @@ class SpatialGrid:
         if not hasattr(component, 'get_occupied_grid_cells'):
             return
 
-        cells = component.get_occupied_grid_cells()
+        cells = set(component.get_occupied_grid_cells())
         for cell in cells:
             self.occupied_cells[cell] = component
+        self._component_cells[component] = cells
 
     def remove_component(self, component: ComponentItem):
         """
@@ -44,9 +64,12 @@ class SpatialGrid:
         if not hasattr(component, 'get_occupied_grid_cells'):
             return
 
-        cells = component.get_occupied_grid_cells()
+        # Free the cells it was recorded at; it may have moved since
+        cells = self._component_cells.pop(component, None)
+        if cells is None:
+            cells = component.get_occupied_grid_cells()
         for cell in cells:
-            if self.occupied_cells.get(cell) == component:
+            if self.occupied_cells.get(cell) is component:
                 del self.occupied_cells[cell]
 
     def update_component(self, component: ComponentItem):
@@ -57,10 +80,18 @@ class SpatialGrid:
         Args:
             component: Component to update
         """
-        # For now, just remove and re-add
-        # Could optimize further by computing delta
-        self.remove_component(component)
-        self.add_component(component)
+        if not hasattr(component, 'get_occupied_grid_cells'):
+            return
+
+        # Only touch the cells it left and the cells it entered
+        new_cells = set(component.get_occupied_grid_cells())
+        old_cells = self._component_cells.get(component, set())
+        for cell in old_cells - new_cells:
+            if self.occupied_cells.get(cell) is component:
+                del self.occupied_cells[cell]
+        for cell in new_cells - old_cells:
+            self.occupied_cells[cell] = component
+        self._component_cells[component] = new_cells
 
     def check_overlap(self, cells: Set[Tuple[int, int]], exclude_component: Optional[ComponentItem] = None) -> bool:
         """
@@ -75,7 +106,7 @@ class SpatialGrid:
         """
         for cell in cells:
             occupant = self.occupied_cells.get(cell)
-            if occupant is not None and occupant != exclude_component:
+            if occupant is not None and occupant is not exclude_component:
                 return True
         return False
 
@@ -103,24 +134,27 @@ class SpatialGrid:
         Returns:
             (gx, gy) tuple of free position, or None if not found
         """
+        # Footprint offsets from the anchor; the shape is the same for every probe
+        if width_cells >= height_cells:  # Horizontal
+            offsets = tuple((dx, 0) for dx in range(width_cells))
+        else:  # Vertical
+            offsets = tuple((0, dy) for dy in range(height_cells))
+        occupied_cells = self.occupied_cells
+
         # Helper to check if a position is valid
         def is_position_free(ax: int, ay: int) -> bool:
-            # Generate footprint at this anchor
-            cells = set()
-            if width_cells >= height_cells:  # Horizontal
-                for dx in range(width_cells):
-                    cells.add((ax + dx, ay))
-            else:  # Vertical
-                for dy in range(height_cells):
-                    cells.add((ax, ay + dy))
-
-            # Check boundaries
-            for cx, cy in cells:
+            for ox, oy in offsets:
+                cx = ax + ox
+                cy = ay + oy
+
+                # Check boundaries
                 if cx < min_gx or cx > max_gx or cy < min_gy or cy > max_gy:
                     return False
 
-            # Check occupation
-            return not self.check_overlap(cells)
+                # Check occupation
+                if (cx, cy) in occupied_cells:
+                    return False
+            return True
 
         # Test start position first
         if is_position_free(start_gx, start_gy):
@@ -128,17 +162,13 @@ class SpatialGrid:
 
         # Spiral search outward
         for radius in range(1, max_radius + 1):
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    # Only check perimeter (not interior)
-                    if abs(dx) != radius and abs(dy) != radius:
-                        continue
-
-                    ax = start_gx + dx
-                    ay = start_gy + dy
+            # Only the perimeter of each ring, not its interior
+            for dx, dy in _ring_offsets(radius):
+                ax = start_gx + dx
+                ay = start_gy + dy
 
-                    if is_position_free(ax, ay):
-                        return (ax, ay)
+                if is_position_free(ax, ay):
+                    return (ax, ay)
 
         return None
 